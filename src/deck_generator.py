@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import random
 import itertools
 import os
@@ -71,6 +72,12 @@ class DeckGenerator:
         random.shuffle(card_pool)
         return tuple(sorted(card_pool[:60]))
 
+    def to_counts(self, deck: list[int]) -> np.ndarray:
+        """Converts a deck of card IDs into a per-card copy count vector indexed by card ID."""
+        counts = np.zeros(len(self.unique_card_names), dtype=np.int8)
+        np.add.at(counts, np.asarray(deck, dtype=np.intp), 1)
+        return counts
+
     def get_deck_inks(self, deck: list[int]) -> tuple[str, ...]:
         """Determines the tuple of inks present in a given deck of card IDs."""
         # Convert numpy.ndarray to a hashable tuple for dictionary key usage
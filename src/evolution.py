@@ -2,20 +2,64 @@
 Handles the fitness evaluation of decks for the genetic algorithm.
 """
 
-import random
+import logging
+import time
+import numpy as np
 import pandas as pd
 import multiprocessing
 from functools import partial
 from typing import Dict, List, Tuple, Optional, Any
 
-from src.game_engine.game_engine import GameState, Player
+from src.game_engine.game_engine import GameState, Player, build_card_index
 from src.deck_generator import DeckGenerator
 from src.game_engine.player_logic import Action
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, get_simulation_logger
 from src.utils.error_handler import safe_operation
 from src.utils.optimization_config import OptimizationManager
 
 logger = get_logger()
+# Per-game messages go to the simulation logger, which detailed_logging controls
+simulation_logger = get_simulation_logger()
+
+class DeckBuildError(ValueError):
+    """Raised when a deck cannot be built from the available card data."""
+
+
+# Smoothing factor for the running average of each matchup's wall-clock duration
+MATCHUP_DURATION_EMA_ALPHA = 0.2
+
+# Per-process state for parallel matchup workers, set once by the pool initializer
+# so that each task only carries a meta deck index instead of both decks.
+_G_CALCULATOR = None
+_G_CANDIDATE = None
+
+
+def _init_matchup_worker(calculator: "FitnessCalculator", candidate_deck: list[str]) -> None:
+    """Pool initializer that stores the calculator and candidate deck in the worker."""
+    global _G_CALCULATOR, _G_CANDIDATE
+    _G_CALCULATOR = calculator
+    _G_CANDIDATE = candidate_deck
+
+
+def _simulate_matchup_idx(task: tuple[int, int, int, int]) -> tuple[int, int, int, float]:
+    """
+    Worker entry point that simulates the candidate against one meta deck by index.
+
+    Args:
+        task: (meta_idx, games_per_matchup, max_turns, seed)
+
+    Returns:
+        tuple: (meta_idx, wins, total_games, elapsed_seconds)
+    """
+    meta_idx, games_per_matchup, max_turns, seed = task
+    # Forked workers inherit identical RNG states, so reseed per matchup; games draw
+    # their shuffles and turn order from this generator only
+    _G_CALCULATOR.rng = np.random.default_rng(seed)
+    meta_deck = _G_CALCULATOR.meta_decks[meta_idx]
+    start = time.perf_counter()
+    wins, games = _G_CALCULATOR._simulate_matchup(_G_CANDIDATE, meta_deck, games_per_matchup, max_turns, meta_idx)
+    return meta_idx, wins, games, time.perf_counter() - start
+
 
 class FitnessCalculator:
     """Calculates the fitness of a given deck."""
@@ -31,15 +75,36 @@ class FitnessCalculator:
         self.meta_decks = meta_decks
         self.deck_generator = deck_generator
         
+        # Card records are looked up by name for every card of every simulated game,
+        # so index the card data once here rather than filtering the DataFrame per card
+        self.card_index = build_card_index(deck_generator.card_df)
+
         # Get optimization settings
         self.optimization_manager = OptimizationManager()
         self.config = self.optimization_manager.get_config()
+
+        # Keep the game engine's per-game logging quiet unless detailed logging is requested.
+        # Only the simulation child logger is adjusted; the shared logger keeps its level.
+        simulation_logger.setLevel(logging.NOTSET if self.config.detailed_logging else logging.WARNING)
         
         # Initialize simulation cache if enabled
         self.simulation_cache = {} if self.config.cache_enabled else None
         self.cache_hits = 0
         self.cache_misses = 0
 
+        # Running average of how long each meta deck matchup takes, used to schedule
+        # the slowest matchups first in the parallel path
+        self.matchup_duration_ema: dict[int, float] = {}
+
+        # PCG64 generator used to break ties on drawn or unresolved games
+        self.rng = np.random.default_rng()
+
+        # Zobrist keys per card id; a deck's cache key is the wrapping uint64 sum
+        # of its cards' keys, which is order-independent and counts duplicates
+        self._zobrist_keys = np.random.default_rng(0x0AC1E).integers(
+            0, np.iinfo(np.uint64).max, size=len(deck_generator.unique_card_names), dtype=np.uint64
+        )
+
     def calculate_fitness(self, candidate_deck: list[str], games_per_matchup: Optional[int] = None, max_turns: Optional[int] = None) -> tuple[float, dict[str, float]]:
         """
         Calculates the fitness of a candidate deck by simulating games against meta decks.
@@ -56,58 +121,65 @@ class FitnessCalculator:
             tuple[float, dict[str, float]]: A tuple containing:
                 - The overall win rate of the candidate deck against the meta.
                 - A dictionary with detailed win rates against each meta deck.
+
+        Raises:
+            DeckBuildError: If the candidate deck contains cards missing from the card data.
         """
-        try:
-            # DIAGNOSTIC: Log candidate deck details
-            print("\n[DIAGNOSTIC] calculate_fitness called")
-            print(f"[DIAGNOSTIC] Candidate deck type: {type(candidate_deck)}")
-            print(f"[DIAGNOSTIC] Candidate deck length: {len(candidate_deck)}")
-            print(f"[DIAGNOSTIC] First 5 cards: {candidate_deck[:5]}")
-            
-            # Use optimization config values if not specified
-            if games_per_matchup is None:
-                games_per_matchup = self.config.game_sample_size
-            if max_turns is None:
-                max_turns = self.config.max_turns_per_game
-                
-            print(f"[DIAGNOSTIC] Using {games_per_matchup} games per matchup, {max_turns} max turns")
-            logger.debug(f"Calculating fitness with {games_per_matchup} games per matchup, {max_turns} max turns")
-            
-            # Create a frozen version of the deck for cache lookups (if caching enabled)
-            if self.config.cache_enabled:
-                # Sort the candidate deck to ensure consistent cache lookups
-                frozen_candidate = tuple(sorted(candidate_deck))
-                print(f"[DIAGNOSTIC] Cache enabled, created frozen candidate")
-
-            total_wins = 0
-            total_games = 0
-            detailed_results = {}
-
-            if not self.meta_decks:
-                logger.warning("No meta decks provided for fitness calculation")
-                print(f"[DIAGNOSTIC] No meta decks available! This is a critical error.")
-                return 0.0, {}
-
-            print(f"[DIAGNOSTIC] Found {len(self.meta_decks)} meta decks for testing")
+        # DIAGNOSTIC: Log candidate deck details
+        print("\n[DIAGNOSTIC] calculate_fitness called")
+        print(f"[DIAGNOSTIC] Candidate deck type: {type(candidate_deck)}")
+        print(f"[DIAGNOSTIC] Candidate deck length: {len(candidate_deck)}")
+        print(f"[DIAGNOSTIC] First 5 cards: {candidate_deck[:5]}")
+        
+        # Use optimization config values if not specified
+        if games_per_matchup is None:
+            games_per_matchup = self.config.game_sample_size
+        if max_turns is None:
+            max_turns = self.config.max_turns_per_game
             
-            # Check if we should use parallel processing
-            if self.config.parallel_simulation and len(self.meta_decks) > 1:
-                print(f"[DIAGNOSTIC] Using parallel fitness calculation")
-                return self._calculate_fitness_parallel(candidate_deck, games_per_matchup, max_turns)
-            else:
-                print(f"[DIAGNOSTIC] Using sequential fitness calculation")
-                return self._calculate_fitness_sequential(candidate_deck, games_per_matchup, max_turns)
-        except Exception as e:
-            print(f"[DIAGNOSTIC] Error calculating fitness: {e}")
-            import traceback
-            print(f"[DIAGNOSTIC] Traceback: {traceback.format_exc()}")
-            logger.error(f"Error calculating fitness: {e}")
-            # Return a minimal but valid result to avoid propagating None
-            return 0.01, {"error": 0.01}  # Small non-zero fitness to prevent total failure
+        print(f"[DIAGNOSTIC] Using {games_per_matchup} games per matchup, {max_turns} max turns")
+        logger.debug(f"Calculating fitness with {games_per_matchup} games per matchup, {max_turns} max turns")
+        
+        total_wins = 0
+        total_games = 0
+        detailed_results = {}
+
+        if not self.meta_decks:
+            logger.warning("No meta decks provided for fitness calculation")
+            print(f"[DIAGNOSTIC] No meta decks available! This is a critical error.")
+            return 0.0, {}
+
+        print(f"[DIAGNOSTIC] Found {len(self.meta_decks)} meta decks for testing")
+
+        unknown_cards = [name for name in candidate_deck if name not in self.card_index]
+        if unknown_cards:
+            raise DeckBuildError(f"Candidate deck contains unknown cards: {unknown_cards[:3]}")
+
+        # Check if this exact deck has been cached
+        cache_key = None
+        if self.config.cache_enabled:
+            cache_key = self._deck_key(candidate_deck)
+            cached_result = self._check_cache(cache_key)
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    lookups = (self.cache_hits + self.cache_misses) or 1
+                    logger.debug("Cache hit for deck calculation (hit rate: %.2f), result: %s",
+                                 self.cache_hits / lookups, cached_result)
+                return cached_result
+        
+        # Check if we should use parallel processing
+        if self.config.parallel_simulation and len(self.meta_decks) > 1:
+            print(f"[DIAGNOSTIC] Using parallel fitness calculation")
+            return self._calculate_fitness_parallel(candidate_deck, games_per_matchup, max_turns, cache_key)
+        else:
+            print(f"[DIAGNOSTIC] Using sequential fitness calculation")
+            return self._calculate_fitness_sequential(candidate_deck, games_per_matchup, max_turns, cache_key)
     
-    def _calculate_fitness_sequential(self, candidate_deck: list[str], games_per_matchup: int, max_turns: int) -> tuple[float, dict[str, float]]:
+    def _calculate_fitness_sequential(self, candidate_deck: list[str], games_per_matchup: int, max_turns: int,
+                                      cache_key: Optional[int] = None) -> tuple[float, dict[str, float]]:
         """
         Sequential implementation of fitness calculation.
+        The result is stored under cache_key when one is given.
         """
         print("\n[DIAGNOSTIC] _calculate_fitness_sequential called")
         print(f"[DIAGNOSTIC] Candidate deck type: {type(candidate_deck)}")
@@ -119,15 +191,6 @@ class FitnessCalculator:
         total_wins = 0
         total_games = 0
         detailed_results = {}
-        
-        # Check if this exact deck has been cached
-        if self.config.cache_enabled:
-            frozen_candidate = tuple(sorted(candidate_deck))
-            cached_result = self._check_cache(frozen_candidate)
-            if cached_result is not None:
-                print(f"[DIAGNOSTIC] Cache hit! Returning cached result: {cached_result}")
-                logger.debug(f"Cache hit for deck calculation (hit rate: {self.cache_hits/(self.cache_hits+self.cache_misses):.2f})")
-                return cached_result
 
         for i, meta_deck in enumerate(self.meta_decks):
             print(f"\n[DIAGNOSTIC] Testing against meta deck {i+1}, length: {len(meta_deck)}")
@@ -150,7 +213,7 @@ class FitnessCalculator:
                         print(f"[DIAGNOSTIC] Early termination at game {j+1}, extrapolating results")
                         logger.debug(f"Early termination for meta deck {i+1} at {j}/{games_per_matchup} games")
                         break
-                
+
                 goes_first = j % 2 == 0
                 print(f"[DIAGNOSTIC] Simulating game {j+1}, candidate goes first: {goes_first}")
                 winner = self.simulate_game(candidate_deck, meta_deck, goes_first, max_turns=max_turns)
@@ -175,37 +238,35 @@ class FitnessCalculator:
         print(f"[DIAGNOSTIC] Total wins: {total_wins}, Total games: {total_games}")
         
         # Cache the result if caching is enabled
-        if self.config.cache_enabled:
-            self._update_cache(frozen_candidate, (overall_win_rate, detailed_results.copy()))
+        if cache_key is not None:
+            self._update_cache(cache_key, (overall_win_rate, detailed_results.copy()))
             print(f"[DIAGNOSTIC] Result cached for future lookup")
             
         return overall_win_rate, detailed_results
     
-    def _calculate_fitness_parallel(self, candidate_deck: list[str], games_per_matchup: int, max_turns: int) -> tuple[float, dict[str, float]]:
+    def _calculate_fitness_parallel(self, candidate_deck: list[str], games_per_matchup: int, max_turns: int,
+                                    cache_key: Optional[int] = None) -> tuple[float, dict[str, float]]:
         """
         Parallel implementation of fitness calculation using multiprocessing.
+        The result is stored under cache_key when one is given.
         """
-        # Check if this exact deck has been cached
-        if self.config.cache_enabled:
-            frozen_candidate = tuple(sorted(candidate_deck))
-            cached_result = self._check_cache(frozen_candidate)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for deck calculation (hit rate: {self.cache_hits/(self.cache_hits+self.cache_misses):.2f})")
-                return cached_result
-        
         num_workers = min(self.config.num_workers, len(self.meta_decks))
         logger.debug(f"Running parallel fitness calculation with {num_workers} workers")
         
-        # Create a pool of workers
-        with multiprocessing.Pool(processes=num_workers) as pool:
+        # Each worker receives the calculator and candidate deck once; tasks only carry indices
+        seeds = self.rng.integers(0, 2**32, size=len(self.meta_decks))
+        # Start the historically slowest matchups first so they don't straggle at the end
+        order = sorted(range(len(self.meta_decks)), key=lambda i: -self.matchup_duration_ema.get(i, 1.0))
+        results = [None] * len(self.meta_decks)
+        with multiprocessing.Pool(processes=num_workers, initializer=_init_matchup_worker,
+                                  initargs=(self, candidate_deck)) as pool:
             # Prepare arguments for each meta deck matchup
-            args = [
-                (candidate_deck, meta_deck, games_per_matchup, max_turns, i)
-                for i, meta_deck in enumerate(self.meta_decks)
-            ]
+            args = [(i, games_per_matchup, max_turns, int(seeds[i])) for i in order]
             
-            # Run simulations in parallel
-            results = pool.starmap(self._simulate_matchup, args)
+            # Run simulations in parallel, placing results back in meta deck order
+            for meta_idx, wins, games, elapsed in pool.imap_unordered(_simulate_matchup_idx, args):
+                results[meta_idx] = (wins, games)
+                self._record_matchup_duration(meta_idx, elapsed)
         
         # Process results
         total_wins = sum(wins for wins, _ in results)
@@ -219,8 +280,8 @@ class FitnessCalculator:
         overall_win_rate = total_wins / total_games if total_games > 0 else 0.0
         
         # Cache the result if caching is enabled
-        if self.config.cache_enabled:
-            self._update_cache(frozen_candidate, (overall_win_rate, detailed_results.copy()))
+        if cache_key is not None:
+            self._update_cache(cache_key, (overall_win_rate, detailed_results.copy()))
             
         return overall_win_rate, detailed_results
     
@@ -233,36 +294,40 @@ class FitnessCalculator:
         Returns:
             tuple: (wins, total_games)
         """
-        try:
-            matchup_wins = 0
-            
-            # Early stopping: If a deck is clearly losing or winning, we can terminate early
-            early_termination_counter = 0
-            early_termination_threshold = games_per_matchup // 2  # 50% threshold
+        matchup_wins = 0
+        
+        # Early stopping: If a deck is clearly losing or winning, we can terminate early
+        early_termination_counter = 0
+        early_termination_threshold = games_per_matchup // 2  # 50% threshold
+        
+        for j in range(games_per_matchup):
+            # Check for early termination conditions
+            if self.config.early_termination and j > games_per_matchup // 2:
+                if matchup_wins >= early_termination_threshold or early_termination_counter >= early_termination_threshold:
+                    # Extrapolate results
+                    ratio_completed = j / games_per_matchup
+                    matchup_wins = int(matchup_wins / ratio_completed)
+                    return matchup_wins, games_per_matchup
             
-            for j in range(games_per_matchup):
-                # Check for early termination conditions
-                if self.config.early_termination:
-                    if matchup_wins >= early_termination_threshold or early_termination_counter >= early_termination_threshold:
-                        # Extrapolate results
-                        ratio_completed = j / games_per_matchup
-                        if ratio_completed > 0:
-                            matchup_wins = int(matchup_wins / ratio_completed)
-                        return matchup_wins, games_per_matchup
+            goes_first = j % 2 == 0
+            winner = self.simulate_game(candidate_deck, meta_deck, goes_first, max_turns=max_turns)
+            if winner == "player1":
+                matchup_wins += 1
+            else:
+                early_termination_counter += 1
                 
-                goes_first = j % 2 == 0
-                winner = self.simulate_game(candidate_deck, meta_deck, goes_first, max_turns=max_turns)
-                if winner == "player1":
-                    matchup_wins += 1
-                else:
-                    early_termination_counter += 1
-                    
-            return matchup_wins, games_per_matchup
-        except Exception as e:
-            logger.error(f"Error simulating matchup: {e}")
-            # Return a minimal valid result
-            return 0, games_per_matchup
+        return matchup_wins, games_per_matchup
     
+    def _record_matchup_duration(self, meta_idx: int, elapsed: float) -> None:
+        """Folds a matchup's wall-clock duration into its running average."""
+        previous = self.matchup_duration_ema.get(meta_idx)
+        if previous is None:
+            self.matchup_duration_ema[meta_idx] = elapsed
+        else:
+            self.matchup_duration_ema[meta_idx] = (
+                MATCHUP_DURATION_EMA_ALPHA * elapsed + (1 - MATCHUP_DURATION_EMA_ALPHA) * previous
+            )
+
     def simulate_game(self, deck1_list: list[str], deck2_list: list[str], goes_first=True, max_turns=100) -> str:
         """
         Simulates a game between two decks.
@@ -275,83 +340,58 @@ class FitnessCalculator:
 
         Returns:
             str: The winner ("player1" or "player2").
+
+        Raises:
+            TypeError: If either deck contains numeric card ids instead of names.
         """
-        print(f"\n[DIAGNOSTIC] simulate_game called")
-        print(f"[DIAGNOSTIC] Player 1 deck type: {type(deck1_list)}, length: {len(deck1_list)}")
-        print(f"[DIAGNOSTIC] Player 2 deck type: {type(deck2_list)}, length: {len(deck2_list)}")
-        
-        # Check if decks contain numeric IDs instead of card names
-        has_numeric_ids = False
+        # Decks must contain card names by this point; numeric IDs mean the caller
+        # skipped the id -> name conversion, so fail loudly instead of guessing a winner
         if deck1_list and isinstance(deck1_list[0], (int, float, np.integer)):
-            print(f"[DIAGNOSTIC] WARNING: Player 1 deck contains numeric IDs, not card names!")
-            has_numeric_ids = True
+            raise TypeError(f"Player 1 deck contains numeric ids, not card names: {deck1_list[:3]}")
         if deck2_list and isinstance(deck2_list[0], (int, float, np.integer)):
-            print(f"[DIAGNOSTIC] WARNING: Player 2 deck contains numeric IDs, not card names!")
-            has_numeric_ids = True
-            
-        # Determine if we should enable detailed logging for this simulation
-        if not self.config.detailed_logging:
-            # Temporarily set logger level to reduce noise during simulation
-            original_level = logger.level
-            logger.setLevel('WARNING')  # Only show warnings and errors during simulation
-            
-        try:
-            # If any deck contains numeric IDs, convert them using deck_generator
-            if has_numeric_ids:
-                print(f"[DIAGNOSTIC] Converting numeric IDs to card names")
-                # This is a critical error - decks should contain card names by this point
-                # For diagnostic purposes, return a random winner
-                return random.choice(["player1", "player2"])
-
-            # Print sample of each deck for verification
-            print(f"[DIAGNOSTIC] Player 1 deck sample: {deck1_list[:5]}")
-            print(f"[DIAGNOSTIC] Player 2 deck sample: {deck2_list[:5]}")
-                
-            # Create players with card data
-            print(f"[DIAGNOSTIC] Creating player objects")
-            try:
-                player1 = Player(player_id=1, deck_list=deck1_list, card_data=self.deck_generator.card_df)
-                print(f"[DIAGNOSTIC] Player 1 created successfully")
-                player2 = Player(player_id=2, deck_list=deck2_list, card_data=self.deck_generator.card_df)
-                print(f"[DIAGNOSTIC] Player 2 created successfully")
-            except Exception as player_error:
-                print(f"[DIAGNOSTIC] Error creating players: {player_error}")
-                raise
-
-            print(f"[DIAGNOSTIC] Creating game state, P1 goes first: {goes_first}")
-            if goes_first:
-                game_state = GameState(player1, player2)
-            else:
-                game_state = GameState(player2, player1)
+            raise TypeError(f"Player 2 deck contains numeric ids, not card names: {deck2_list[:3]}")
 
-            print(f"[DIAGNOSTIC] Running game with max_turns={max_turns}")
-            winner_obj = game_state.run_game(max_turns=max_turns)
-            print(f"[DIAGNOSTIC] Game completed, winner object: {winner_obj}")
+        # Create players with card data
+        player1 = Player(player_id=1, deck_list=deck1_list, card_index=self.card_index, rng=self.rng)
+        player2 = Player(player_id=2, deck_list=deck2_list, card_index=self.card_index, rng=self.rng)
 
-            if winner_obj is None:
-                # Handle draws or unresolved games
-                result = random.choice(["player1", "player2"])
-                print(f"[DIAGNOSTIC] Game ended in draw or was unresolved. Random winner: {result}")
-                return result
-            
-            if winner_obj.player_id == player1.player_id:
-                print(f"[DIAGNOSTIC] Player 1 won the game")
-                return "player1"
-            else:
-                print(f"[DIAGNOSTIC] Player 2 won the game")
-                return "player2"
-        except Exception as e:
-            print(f"[DIAGNOSTIC] Critical error simulating game: {e}")
-            import traceback
-            print(f"[DIAGNOSTIC] Traceback: {traceback.format_exc()}")
-            logger.error(f"Error simulating game: {e}")
-            # Return a random winner to keep the process moving
-            return random.choice(["player1", "player2"])
-        finally:
-            # Restore logger level if we changed it
-            if not self.config.detailed_logging:
-                logger.setLevel(original_level)
+        simulation_logger.debug("Simulating game, P1 goes first: %s, max_turns=%d", goes_first, max_turns)
+        if goes_first:
+            game_state = GameState(player1, player2)
+        else:
+            game_state = GameState(player2, player1)
+
+        winner_obj = game_state.run_game(max_turns=max_turns)
+
+        if winner_obj is None:
+            # Handle draws or unresolved games
+            result = self._random_winner()
+            simulation_logger.debug("Game ended in draw or was unresolved. Random winner: %s", result)
+            return result
+        
+        if winner_obj.player_id == player1.player_id:
+            return "player1"
+        else:
+            return "player2"
     
+    def _deck_key(self, deck: list[str]) -> int:
+        """
+        Computes an order-independent cache key for a deck.
+
+        Args:
+            deck (list[str]): The deck as a list of card names.
+
+        Returns:
+            int: The additive Zobrist hash of the deck's cards; duplicates add their key once per copy.
+        """
+        card_to_id = self.deck_generator.card_to_id
+        ids = [card_to_id[name] for name in deck]
+        return int(self._zobrist_keys[ids].sum(dtype=np.uint64))
+
+    def _random_winner(self) -> str:
+        """Picks a winner uniformly at random using the calculator's PCG64 stream."""
+        return "player1" if self.rng.integers(0, 2) == 0 else "player2"
+
     def _check_cache(self, frozen_deck) -> Optional[tuple[float, dict[str, float]]]:
         """
         Check if a deck's fitness calculation is in the cache.
@@ -362,7 +402,7 @@ class FitnessCalculator:
         Returns:
             Cached result or None if not found
         """
-        if not self.config.cache_enabled or not self.simulation_cache:
+        if self.simulation_cache is None:
             return None
             
         if frozen_deck in self.simulation_cache:
@@ -380,7 +420,7 @@ class FitnessCalculator:
             frozen_deck: A hashable representation of the deck
             result: The calculation result to cache
         """
-        if not self.config.cache_enabled or not self.simulation_cache:
+        if self.simulation_cache is None:
             return
             
         # If cache is full, remove oldest entry (FIFO)
@@ -1,5 +1,7 @@
 from typing import List, Dict, Any, Optional, Tuple
 from typing import TYPE_CHECKING
+from operator import itemgetter
+import numpy as np
 if TYPE_CHECKING:
     from .game_engine import Card, GameState, Player
 
@@ -25,6 +27,33 @@ KEYWORD_MULTIPLIERS = {
     # Default multiplier for cards without keywords is 1.0
 }
 
+# KEYWORD_MULTIPLIERS as parallel arrays: bit i of a card's keyword mask stands for
+# KEYWORD_NAMES[i], whose multiplier is KEYWORD_MULTS[i]
+KEYWORD_NAMES = tuple(KEYWORD_MULTIPLIERS)
+KEYWORD_MULTS = np.array([KEYWORD_MULTIPLIERS[k] for k in KEYWORD_NAMES])
+KEYWORD_MASKS = (1 << np.arange(len(KEYWORD_NAMES))).astype(np.uint16)
+
+def keyword_bits(card: 'Card') -> int:
+    """Packs the KEYWORD_MULTIPLIERS keywords a card has into a bitmask."""
+    bits = 0
+    for bit, keyword in enumerate(KEYWORD_NAMES):
+        if card.has_keyword(keyword):
+            bits |= 1 << bit
+    return bits
+
+def keyword_multiplier(card: 'Card') -> float:
+    """
+    Returns the product of the KEYWORD_MULTIPLIERS for the keywords a card has.
+    The result is cached on the card and only recomputed after its keywords change.
+    """
+    if not getattr(card, '_keyword_multiplier_dirty', True):
+        return card._cached_kw_mult
+    
+    multiplier = float(np.prod(np.where(keyword_bits(card) & KEYWORD_MASKS, KEYWORD_MULTS, 1.0)))
+    card._cached_kw_mult = multiplier
+    card._keyword_multiplier_dirty = False
+    return multiplier
+
 def evaluate_board_state(game: 'GameState', player_id: int) -> float:
     """
     Comprehensive board state evaluation function that returns a numerical score
@@ -39,29 +68,20 @@ def evaluate_board_state(game: 'GameState', player_id: int) -> float:
     # 1. Lore Delta - Most important factor
     lore_delta = (player.lore - opponent.lore) * LORE_WEIGHT
     
-    # 2. Potential Lore - Predicts next turn's lore swing
-    player_potential_lore = sum(c.lore for c in player.play_area if not c.is_exerted and c.card_type == 'Character')
-    # Add passive lore from locations
-    player_potential_lore += sum(c.lore for c in player.play_area if c.card_type == 'Location')
-    
-    opponent_potential_lore = sum(c.lore for c in opponent.play_area if not c.is_exerted and c.card_type == 'Character')
-    # Add passive lore from locations
-    opponent_potential_lore += sum(c.lore for c in opponent.play_area if c.card_type == 'Location')
+    # One pass over each board collects potential lore, ready characters and board presence
+    player_potential_lore, player_ready_characters, player_board_presence = _scan_board(player.play_area)
+    opponent_potential_lore, opponent_ready_characters, opponent_board_presence = _scan_board(opponent.play_area)
     
+    # 2. Potential Lore - Predicts next turn's lore swing
     potential_lore_delta = (player_potential_lore - opponent_potential_lore) * POTENTIAL_LORE_WEIGHT
     
     # 3. Board Presence - Weighted sum of stats and keywords
-    player_board_presence = calculate_board_presence(player.play_area)
-    opponent_board_presence = calculate_board_presence(opponent.play_area)
     board_presence_delta = (player_board_presence - opponent_board_presence) * BOARD_PRESENCE_WEIGHT
     
     # 4. Card Advantage
     card_advantage = (len(player.hand) - len(opponent.hand)) * CARD_ADVANTAGE_WEIGHT
     
     # 5. Tempo & Initiative
-    player_ready_characters = sum(1 for c in player.play_area if not c.is_exerted and c.card_type == 'Character')
-    opponent_ready_characters = sum(1 for c in opponent.play_area if not c.is_exerted and c.card_type == 'Character')
-    
     # Calculate available ink as a measure of resources
     player_available_ink = sum(1 for c in player.inkwell if not c.is_exerted)
     opponent_available_ink = sum(1 for c in opponent.inkwell if not c.is_exerted)
@@ -79,32 +99,40 @@ def calculate_board_presence(cards: List['Card']) -> float:
     Calculate the weighted board presence value for a list of cards.
     Considers both stats (strength, willpower) and keywords.
     """
+    return _scan_board(cards)[2]
+
+def _scan_board(cards: List['Card']) -> Tuple[float, int, float]:
+    """
+    Single pass over the cards in a play area.
+    
+    Returns:
+        (potential lore, ready characters, board presence)
+    """
+    potential_lore = 0
+    ready_characters = 0
     total_value = 0.0
     
     for card in cards:
-        if card.card_type == 'Character':
-            # Base value is the sum of strength and willpower
-            base_value = card.strength + card.willpower
-            
-            # Apply keyword multipliers
-            keyword_multiplier = 1.0
-            for keyword in KEYWORD_MULTIPLIERS:
-                if card.has_keyword(keyword):
-                    keyword_multiplier *= KEYWORD_MULTIPLIERS[keyword]
-            
-            # Add to total
-            total_value += base_value * keyword_multiplier
-        elif card.card_type == 'Item':
+        card_type = card.card_type
+        if card_type == 'Character':
+            if not card.is_exerted:
+                potential_lore += card.lore
+                ready_characters += 1
+            # Base value is the sum of strength and willpower, scaled by the cached keyword multiplier.
+            # Boards hold a handful of cards, so a plain accumulation beats building arrays for np.dot.
+            total_value += (card.strength + card.willpower) * keyword_multiplier(card)
+        elif card_type == 'Item':
             # Items generally provide utility, assign a basic value
             total_value += 2.0  # Basic value for an item
-        elif card.card_type == 'Location':
-            # Locations with lore are valuable
-            if hasattr(card, 'lore') and card.lore > 0:
+        elif card_type == 'Location':
+            # Locations with lore are valuable, and their lore counts as passive potential lore
+            if card.lore > 0:
+                potential_lore += card.lore
                 total_value += card.lore * 3.0  # Value based on passive lore generation
             else:
                 total_value += 1.5  # Base value for a location
     
-    return total_value
+    return potential_lore, ready_characters, total_value
 
 def evaluate_inkwell_candidate(card: 'Card', player: 'Player', game: 'GameState') -> float:
     """
@@ -131,11 +159,11 @@ def evaluate_inkwell_candidate(card: 'Card', player: 'Player', game: 'GameState'
     opponent = game.get_opponent(player.player_id)
     
     # Item removal tech cards are less useful if opponent has no items
-    if "banish an item" in str(card.abilities).lower() and not any(c.card_type == 'Item' for c in opponent.play_area):
+    if card.banishes_item and not any(c.card_type == 'Item' for c in opponent.play_area):
         score += 2.5
     
     # Character removal tech is less useful if opponent has no characters
-    if "banish a character" in str(card.abilities).lower() and not any(c.card_type == 'Character' for c in opponent.play_area):
+    if card.banishes_character and not any(c.card_type == 'Character' for c in opponent.play_area):
         score += 2.5
     
     # 4. Core Win Condition - Avoid inking key cards
@@ -144,18 +172,43 @@ def evaluate_inkwell_candidate(card: 'Card', player: 'Player', game: 'GameState'
         score -= 3.0
     
     # High lore characters are key to winning
-    if card.card_type == 'Character' and hasattr(card, 'lore') and isinstance(card.lore, int) and card.lore >= 3:
+    if card.card_type == 'Character' and card.lore >= 3:
         score -= 2.5
     
     # High strength & willpower characters are generally important
-    if (card.card_type == 'Character' and 
-        hasattr(card, 'strength') and isinstance(card.strength, (int, float)) and
-        hasattr(card, 'willpower') and isinstance(card.willpower, (int, float)) and
-        (card.strength + card.willpower) >= 10):
+    if card.card_type == 'Character' and (card.strength + card.willpower) >= 10:
         score -= 2.0
     
     return score
 
+def max_ready_strength(cards: List['Card']) -> Optional[int]:
+    """Returns the highest strength among ready characters in cards, or None if there are none."""
+    return max(
+        (card.strength for card in cards if card.card_type == 'Character' and not card.is_exerted),
+        default=None,
+    )
+
+def score_actions(game: 'GameState', player: 'Player', actions: List[Any]) -> List[Tuple[Any, float]]:
+    """
+    Sets action.score on each action to its immediate score on the current board.
+    
+    Returns:
+        List of (action, score) tuples in the order the actions were given
+    """
+    # The strongest ready opponent character decides whether a quester is exposed;
+    # it is the same for every action, so scan the opponent's board once
+    opponent_threat = max_ready_strength(game.get_opponent(player.player_id).play_area)
+
+    action_scores = []
+    for action in actions:
+        # Actions score themselves from the current board; anything without
+        # an immediate_score (e.g. test doubles) gets a neutral score
+        scorer = getattr(type(action), 'immediate_score', None)
+        score = scorer(action, game, player, opponent_threat) if scorer is not None else 1.0
+        action.score = score
+        action_scores.append((action, score))
+    return action_scores
+
 def perform_lookahead_analysis(game: 'GameState', player: 'Player', actions: List[Any], depth: int = 1) -> List[Tuple[Any, float]]:
     """
     Performs limited lookahead analysis to evaluate the best action considering opponent responses.
@@ -172,63 +225,16 @@ def perform_lookahead_analysis(game: 'GameState', player: 'Player', actions: Lis
     if not actions:
         return []
     
-    # For each action, clone the game state and simulate action
-    action_scores = []
-    
-    for action in actions:
-        # Score the action immediately using current board state
-        immediate_score = 0
-        
-        # Use simple heuristics if we're only doing depth 1 (no full cloning)
-        if depth <= 1:
-            # Different scoring based on action type
-            if hasattr(action, 'card') and hasattr(action.card, 'lore'):
-                immediate_score = action.card.lore * 2.0  # Value for playing cards with lore
-                
-            # Questing actions get value based on lore gained
-            if hasattr(action, 'character') and hasattr(action.character, 'lore'):
-                immediate_score = action.character.lore * 3.0
-                
-                # Check if the character would be vulnerable to challenges after questing
-                opponent = game.get_opponent(player.player_id)
-                for opp_char in opponent.play_area:
-                    if (opp_char.card_type == 'Character' and not opp_char.is_exerted and 
-                            opp_char.strength >= action.character.willpower):
-                        immediate_score -= 2.0  # Penalty for being vulnerable
-                        break
-            
-            # Challenge actions get value based on favorable trades
-            if hasattr(action, 'attacker') and hasattr(action, 'defender'):
-                # Check if we have attributes needed for comparison (handle mocks in tests)
-                if (hasattr(action, 'attacker') and hasattr(action, 'defender') and
-                    hasattr(action.attacker, 'strength') and hasattr(action.defender, 'willpower') and
-                    hasattr(action.defender, 'strength') and hasattr(action.attacker, 'willpower') and
-                    all(isinstance(x, (int, float)) for x in [
-                        action.attacker.strength, action.defender.willpower,
-                        action.defender.strength, action.attacker.willpower
-                    ])):
-                    # Good trade if we can banish them but they can't banish us
-                    if (action.attacker.strength >= action.defender.willpower and 
-                            action.defender.strength < action.attacker.willpower):
-                        immediate_score = 4.0
-                    # Even trade if both get banished
-                    elif (action.attacker.strength >= action.defender.willpower and 
-                            action.defender.strength >= action.attacker.willpower):
-                        immediate_score = 1.0
-                    # Bad trade if they survive but we don't
-                    else:
-                        immediate_score = -3.0
-                else:
-                    # Default scores for tests with mock objects
-                    immediate_score = 1.0
-        
-        else:
-            # For deeper analysis (not fully implemented yet)
-            # TODO: Clone game state and run full simulation
-            immediate_score = 0  # Placeholder for now
-        
-        action.score = immediate_score
-        action_scores.append((action, immediate_score))
+    if depth <= 1:
+        action_scores = score_actions(game, player, actions)
+    else:
+        # For deeper analysis (not fully implemented yet)
+        # TODO: Clone game state and run full simulation
+        action_scores = []
+        for action in actions:
+            action.score = 0  # Placeholder for now
+            action_scores.append((action, 0))
     
     # Sort by score, highest first
-    return sorted(action_scores, key=lambda x: x[1], reverse=True)
+    action_scores.sort(key=itemgetter(1), reverse=True)
+    return action_scores
@@ -0,0 +1,66 @@
+"""Runs batches of independent, seeded games across worker processes."""
+import multiprocessing
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .game_engine import GameState, Player
+
+# Per-worker matchup, set once by the pool initializer so tasks only carry a seed
+_G_MATCHUP: Optional[tuple] = None
+
+
+def simulate_game(seed: int, deck1_list: List[str], deck2_list: List[str],
+                  card_index: Dict[str, Dict[str, Any]], max_turns: int = 50) -> Optional[int]:
+    """
+    Plays a single game with every random choice drawn from the given seed.
+
+    The deck shuffles use a generator local to this game, so no global random
+    state is read or changed.
+
+    Returns:
+        Optional[int]: The winning player's id (1 or 2), or None for a draw.
+    """
+    rng = np.random.default_rng(seed)
+    player1 = Player(player_id=1, deck_list=deck1_list, card_index=card_index, rng=rng)
+    player2 = Player(player_id=2, deck_list=deck2_list, card_index=card_index, rng=rng)
+    winner = GameState(player1, player2).run_game(max_turns=max_turns)
+    return winner.player_id if winner is not None else None
+
+
+def _init_batch_worker(deck1_list: List[str], deck2_list: List[str],
+                       card_index: Dict[str, Dict[str, Any]], max_turns: int) -> None:
+    """Pool initializer that stores the matchup in the worker."""
+    global _G_MATCHUP
+    _G_MATCHUP = (deck1_list, deck2_list, card_index, max_turns)
+
+
+def _simulate_seed(seed: int) -> Optional[int]:
+    """Worker entry point that plays the stored matchup with one seed."""
+    return simulate_game(seed, *_G_MATCHUP)
+
+
+def simulate_games(n_games: int, deck1_list: List[str], deck2_list: List[str],
+                   card_index: Dict[str, Dict[str, Any]], max_turns: int = 50,
+                   num_workers: Optional[int] = None, base_seed: int = 0) -> List[Optional[int]]:
+    """
+    Plays n_games of deck1 against deck2, seeded base_seed, base_seed + 1, ...
+
+    Games are independent, so they are spread over a process pool; results come back
+    in seed order and match a sequential run with the same seeds.
+
+    Args:
+        num_workers: Worker processes to use; None uses every core, 1 runs in-process.
+
+    Returns:
+        List[Optional[int]]: The winner of each game (1, 2, or None for a draw).
+    """
+    seeds = range(base_seed, base_seed + n_games)
+    num_workers = num_workers or multiprocessing.cpu_count()
+    if num_workers == 1 or n_games <= 1:
+        return [simulate_game(seed, deck1_list, deck2_list, card_index, max_turns) for seed in seeds]
+
+    chunksize = max(1, n_games // (num_workers * 4))
+    with multiprocessing.Pool(processes=num_workers, initializer=_init_batch_worker,
+                              initargs=(deck1_list, deck2_list, card_index, max_turns)) as pool:
+        return pool.map(_simulate_seed, seeds, chunksize=chunksize)
@@ -1,8 +1,110 @@
-from typing import Dict, Callable, Any, List, Optional, TYPE_CHECKING
+from enum import IntEnum
+from itertools import chain
+from typing import Dict, Callable, Any, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.game_engine.game_engine import GameState, Player, Card
 
+class EffectKind(IntEnum):
+    """Integer ids for the supported effect names; member names match the schema 'effect' strings."""
+    DealDamage = 0
+    DrawCard = 1
+    Banish = 2
+    GainStrength = 3
+    ReturnToHand = 4
+    GainKeyword = 5
+    ADD_KEYWORD = 6
+    SET_SHIFT_COST = 7
+    SINGER = 8
+
+EFFECT_IDS: Dict[str, int] = {kind.name: int(kind) for kind in EffectKind}
+
+def assign_effect_id(effect_schema: Dict[str, Any]) -> None:
+    """Stores the EffectKind id for the schema's effect name under 'effect_id', if it is supported."""
+    effect_id = EFFECT_IDS.get(effect_schema.get('effect'))
+    if effect_id is not None:
+        effect_schema['effect_id'] = effect_id
+
+# Schema keys that mark an effect as a triggered ability, which goes into The Bag
+TRIGGER_CONDITIONS = (
+    'when_enters_play',
+    'when_character_enters_play',
+    'when_banished',
+    'at_start_of_turn',
+    'at_end_of_turn',
+    'when_quests',
+    'when_challenges',
+)
+
+_NOT_COMPILED = object()
+
+# Candidate targets per target type, as a function of (controller, opponent)
+TARGET_CANDIDATES: Dict[str, Callable[[Any, Any], Iterable[Any]]] = {
+    'AllCharacters': lambda controller, opponent: chain(controller.play_area, opponent.play_area),
+    'OpponentCharacters': lambda controller, opponent: opponent.play_area,
+    'FriendlyCharacters': lambda controller, opponent: controller.play_area,
+    'Opponent': lambda controller, opponent: (opponent,),  # The opponent player object
+    'Controller': lambda controller, opponent: (controller,),  # The controller player object
+}
+
+# Target types whose candidates are all cards, so a predicate that rejects every card leaves nothing
+CHARACTER_TARGET_TYPES = frozenset(('AllCharacters', 'OpponentCharacters', 'FriendlyCharacters'))
+
+def match_no_card(card: Any) -> bool:
+    """Predicate for filter combinations that no card can satisfy."""
+    return False
+
+def compile_target_predicate(effect_schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """Builds a card filter from the schema's target filters, checking only the filters it sets.
+
+    Returns None when the schema has no filters, so every card target passes, and
+    match_no_card when the filters contradict each other.
+    """
+    checks: List[Callable[[Any], bool]] = []
+
+    cost_less_than = effect_schema.get('cost_less_than')
+    if cost_less_than is not None:
+        checks.append(lambda card: card.cost < cost_less_than)
+
+    cost_equal_to = effect_schema.get('cost_equal_to')
+    if cost_equal_to is not None:
+        checks.append(lambda card: card.cost == cost_equal_to)
+
+    willpower_less_than = effect_schema.get('willpower_less_than')
+    if willpower_less_than is not None:
+        checks.append(lambda card: card.willpower is not None and card.willpower < willpower_less_than)
+
+    is_exerted = effect_schema.get('is_exerted')
+    if is_exerted is not None:
+        checks.append(lambda card: card.is_exerted == is_exerted)
+
+    has_keyword = effect_schema.get('has_keyword')
+    if has_keyword is not None:
+        checks.append(lambda card: card.has_keyword(has_keyword))
+
+    card_type = effect_schema.get('card_type')
+    if card_type is not None:
+        checks.append(lambda card: card.card_type == card_type)
+
+    # Costs and willpower are never negative, so some filter combinations rule out every card
+    if ((cost_less_than is not None and cost_less_than <= 0) or
+            (willpower_less_than is not None and willpower_less_than <= 0) or
+            (cost_equal_to is not None and (cost_equal_to < 0 or
+                                             (cost_less_than is not None and cost_equal_to >= cost_less_than)))):
+        return match_no_card
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    def predicate(card: Any) -> bool:
+        for check in checks:
+            if not check(card):
+                return False
+        return True
+    return predicate
+
 class EffectResolver:
     """Translates a canonical effect schema into a concrete game state change."""
 
@@ -10,17 +112,19 @@ class EffectResolver:
         self.game = game
         self.Card = card_class
         self.Player = player_class
-        self.effect_map: Dict[str, Callable[..., None]] = {
-            'DealDamage': self._resolve_deal_damage,
-            'DrawCard': self._resolve_draw_card,
-            'Banish': self._resolve_banish,
-            'GainStrength': self._resolve_gain_strength,
-            'ReturnToHand': self._resolve_return_to_hand,
-            'GainKeyword': self._resolve_gain_keyword,
-            'ADD_KEYWORD': self._resolve_add_keyword,
-            'SET_SHIFT_COST': self._resolve_set_shift_cost,
-            'SINGER': self._resolve_singer,
-        }
+        # Indexed by EffectKind, so the order must match the enum values.
+        # Each handler is called as handler(card_targets, source_card, effect_schema)
+        self._handlers: Tuple[Callable[[List['Card'], 'Card', Dict[str, Any]], None], ...] = (
+            self._resolve_deal_damage,
+            self._resolve_draw_card,
+            self._resolve_banish,
+            self._resolve_gain_strength,
+            self._resolve_return_to_hand,
+            self._resolve_gain_keyword,
+            self._resolve_add_keyword,
+            self._resolve_set_shift_cost,
+            self._resolve_singer,
+        )
 
     def resolve_effect(self, effect_schema: Dict[str, Any], source_card: 'Card', chosen_targets: Optional[List[Any]] = None):
         """
@@ -30,9 +134,13 @@ class EffectResolver:
         If the effect is a triggered ability, it will be added to The Bag.
         Otherwise, it will be executed immediately.
         """
-        handler = self.effect_map.get(effect_schema.get('effect'))
-        if not handler:
-            return
+        # Card abilities carry a pre-resolved effect_id; ad hoc schemas fall back to the name
+        effect_id = effect_schema.get('effect_id')
+        if effect_id is None:
+            effect_id = EFFECT_IDS.get(effect_schema.get('effect'))
+            if effect_id is None:
+                return
+        handler = self._handlers[effect_id]
         
         # If the game's trigger bag is resolving and this is a new triggered ability,
         # add it to the pending triggers instead of resolving it immediately
@@ -45,12 +153,17 @@ class EffectResolver:
             )
             return
         
-        targets = self._get_targets(effect_schema, source_card, chosen_targets)
-        if not targets:
+        # Every handler acts on cards, so drop player targets once here rather than
+        # type-checking each target inside the handlers
+        card_class = self.Card
+        card_targets = [target for target in self._get_targets(effect_schema, source_card, chosen_targets)
+                        if isinstance(target, card_class)]
+        if not card_targets:
             return
 
-        # Pass the whole schema as kwargs to the handler, plus the source card
-        handler(targets=targets, source_card=source_card, **effect_schema)
+        # Handlers read their parameters straight from the schema, which avoids
+        # building a kwargs dict on every resolution
+        handler(card_targets, source_card, effect_schema)
 
     def is_triggered_ability(self, effect_schema: Dict[str, Any]) -> bool:
         """
@@ -62,23 +175,12 @@ class EffectResolver:
         Returns:
             bool: True if this is a triggered ability, False otherwise
         """
-        # Check for trigger condition keywords in the effect schema
-        trigger_conditions = [
-            'when_enters_play',
-            'when_character_enters_play',
-            'when_banished',
-            'at_start_of_turn',
-            'at_end_of_turn',
-            'when_quests',
-            'when_challenges'
-        ]
-        
-        # If any of these conditions are in the schema, it's a triggered ability
-        for condition in trigger_conditions:
-            if effect_schema.get(condition):
-                return True
-        
-        return False
+        # Classified once per schema; the answer is cached on the schema itself
+        is_triggered = effect_schema.get('_is_triggered')
+        if is_triggered is None:
+            is_triggered = any(effect_schema.get(condition) for condition in TRIGGER_CONDITIONS)
+            effect_schema['_is_triggered'] = is_triggered
+        return is_triggered
 
     def _get_targets(self, effect_schema: Dict[str, Any], source_card: 'Card', chosen_targets: Optional[List[Any]] = None) -> List[Any]:
         """Determines the target(s) of an effect based on the schema.
@@ -113,118 +215,87 @@ class EffectResolver:
             # Return early for tests that don't need advanced targeting
             return chosen_targets if chosen_targets else []
             
-        # Get the controller and opponent of the source card
-        controller = self.game.get_player(source_card.owner_player_id)
-        opponent = self.game.get_opponent(source_card.owner_player_id)
-        
-        # Determine targets based on target_type
-        targets = []
-        if target_type == 'AllCharacters':
-            targets = controller.play_area + opponent.play_area
-        elif target_type == 'OpponentCharacters':
-            targets = opponent.play_area
-        elif target_type == 'FriendlyCharacters':
-            targets = controller.play_area
-        elif target_type == 'Opponent':
-            targets = [opponent]  # Return the opponent player object
-        elif target_type == 'Controller':
-            targets = [controller]  # Return the controller player object
-        
-        # Apply filters based on card properties
-        filtered_targets = []
-        for target in targets:
-            # Skip filtering for player objects
-            if isinstance(target, self.Player):
-                filtered_targets.append(target)
-                continue
-                
-            # Apply filters only to Card objects
-            if isinstance(target, self.Card):
-                # Filter by cost
-                cost_less_than = effect_schema.get('cost_less_than')
-                if cost_less_than is not None and target.cost >= cost_less_than:
-                    continue
-                    
-                cost_equal_to = effect_schema.get('cost_equal_to')
-                if cost_equal_to is not None and target.cost != cost_equal_to:
-                    continue
-                
-                # Filter by willpower
-                willpower_less_than = effect_schema.get('willpower_less_than')
-                if willpower_less_than is not None and (target.willpower is None or target.willpower >= willpower_less_than):
-                    continue
-                
-                # Filter by exerted status
-                is_exerted = effect_schema.get('is_exerted')
-                if is_exerted is not None and target.is_exerted != is_exerted:
-                    continue
-                
-                # Filter by keyword
-                has_keyword = effect_schema.get('has_keyword')
-                if has_keyword is not None and not target.has_keyword(has_keyword):
-                    continue
-                    
-                # Filter by card type
-                card_type = effect_schema.get('card_type')
-                if card_type is not None and target.card_type != card_type:
-                    continue
-                
-                # All filters passed, add to filtered targets
-                filtered_targets.append(target)
+        select_candidates = TARGET_CANDIDATES.get(target_type)
+        if select_candidates is None:
+            return []
+
+        # Filters based on card properties, compiled once per schema
+        predicate = effect_schema.get('_target_predicate', _NOT_COMPILED)
+        if predicate is _NOT_COMPILED:
+            predicate = effect_schema['_target_predicate'] = compile_target_predicate(effect_schema)
+        if predicate is match_no_card and target_type in CHARACTER_TARGET_TYPES:
+            return []
+
+        # Candidates come from the controller's and opponent's zones, without copying them
+        candidates = select_candidates(
+            self.game.get_player(source_card.owner_player_id),
+            self.game.get_opponent(source_card.owner_player_id),
+        )
         
-        return filtered_targets
+        # Player objects skip filtering; Card objects must pass the predicate
+        player_class, card_class = self.Player, self.Card
+        return [
+            target for target in candidates
+            if isinstance(target, player_class)
+            or (isinstance(target, card_class) and (predicate is None or predicate(target)))
+        ]
 
-    def _resolve_deal_damage(self, targets: List['Card'], value: int, **kwargs):
+    def _resolve_deal_damage(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
+        value = effect_schema['value']
         for target_card in targets:
-            if isinstance(target_card, self.Card) and hasattr(target_card, 'take_damage'):
-                target_card.take_damage(value)
+            target_card.take_damage(value)
 
-    def _resolve_draw_card(self, targets: List['Card'], value: int, **kwargs):
+    def _resolve_draw_card(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
+        value = effect_schema['value']
         # This handler receives cards as targets (e.g., from a 'Self' target).
         # We need to find the owner of the card and make them draw.
         for target_card in targets:
-            if isinstance(target_card, self.Card) and target_card.owner_player_id is not None:
+            if target_card.owner_player_id is not None:
                 owner_player = self.game.get_player(target_card.owner_player_id)
                 if owner_player:
                     owner_player.draw_cards(value)
 
-    def _resolve_banish(self, targets: List['Card'], **kwargs):
+    def _resolve_banish(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
         for target_card in targets:
-            if isinstance(target_card, self.Card) and target_card.owner_player_id is not None:
+            if target_card.owner_player_id is not None:
                 owner_player = self.game.get_player(target_card.owner_player_id)
                 if owner_player:
                     owner_player.banish_character(target_card)
 
-    def _resolve_gain_strength(self, targets: List['Card'], value: int, duration: str, source_card: 'Card', **kwargs):
-        modifier = {'strength': value, 'duration': duration, 'player_id': source_card.owner_player_id}
+    def _resolve_gain_strength(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
+        modifier = {'strength': effect_schema['value'], 'duration': effect_schema['duration'],
+                    'player_id': source_card.owner_player_id}
         for target_card in targets:
-            if isinstance(target_card, self.Card) and hasattr(target_card, 'strength_modifiers'):
-                target_card.strength_modifiers.append(modifier)
+            target_card.strength_modifiers.append(modifier)
 
-    def _resolve_return_to_hand(self, targets: List['Card'], **kwargs):
+    def _resolve_return_to_hand(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
         for target_card in targets:
-            if isinstance(target_card, self.Card) and target_card.owner_player_id is not None:
+            if target_card.owner_player_id is not None:
                 owner_player = self.game.get_player(target_card.owner_player_id)
                 if owner_player:
                     owner_player.return_to_hand(target_card)
 
-    def _resolve_gain_keyword(self, targets: List['Card'], value: str, duration: str, source_card: 'Card', **kwargs):
-        modifier = {'keyword': value, 'duration': duration, 'player_id': source_card.owner_player_id}
+    def _resolve_gain_keyword(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
+        modifier = {'keyword': effect_schema['value'], 'duration': effect_schema['duration'],
+                    'player_id': source_card.owner_player_id}
         for target_card in targets:
-            if isinstance(target_card, self.Card) and hasattr(target_card, 'keyword_modifiers'):
-                target_card.keyword_modifiers.append(modifier)
+            target_card.keyword_modifiers.append(modifier)
+            target_card.mark_keywords_changed()
 
-    def _resolve_add_keyword(self, targets: List['Card'], value: str, **kwargs):
+    def _resolve_add_keyword(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
+        value = effect_schema['value']
         for target_card in targets:
-            if isinstance(target_card, self.Card) and hasattr(target_card, 'keywords'):
-                target_card.keywords.add(value)
+            target_card.keywords.add(value)
+            target_card.mark_keywords_changed()
 
-    def _resolve_set_shift_cost(self, targets: List['Card'], value: int, **kwargs):
+    def _resolve_set_shift_cost(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
+        value = effect_schema['value']
         for target_card in targets:
-            if isinstance(target_card, self.Card) and hasattr(target_card, 'keywords'):
-                target_card.keywords.add(f"Shift {value}")
+            target_card.keywords.add(f"Shift {value}")
+            target_card.mark_keywords_changed()
 
-    def _resolve_singer(self, targets: List['Card'], value: int, **kwargs):
+    def _resolve_singer(self, targets: List['Card'], source_card: 'Card', effect_schema: Dict[str, Any]):
+        value = effect_schema['value']
         for target_card in targets:
-            if isinstance(target_card, self.Card) and hasattr(target_card, 'keywords'):
-                target_card.keywords.add(f"Singer {value}")
+            target_card.keywords.add(f"Singer {value}")
+            target_card.mark_keywords_changed()
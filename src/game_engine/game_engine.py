@@ -1,23 +1,67 @@
-import random
 import json
 import uuid
-from typing import List, Dict, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Optional, Any, Tuple, TYPE_CHECKING
+import numpy as np
 import pandas as pd
 
 from . import player_logic
-from .effect_resolver import EffectResolver
+from .effect_resolver import EffectResolver, assign_effect_id
 from .trigger_bag import TriggerBag
-from src.utils.logger import get_logger
+from src.utils.logger import get_simulation_logger
 from src.utils.error_handler import safe_operation
 
 # Get the logger instance
-logger = get_logger()
+logger = get_simulation_logger()
 
 if TYPE_CHECKING:
     from .game_engine import GameState
 
+# Deck shuffles draw from this generator unless the caller passes its own;
+# permutation() runs Fisher-Yates in C rather than one interpreter-level random call per swap
+_RNG = np.random.default_rng()
+
+def build_card_index(card_data: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Maps each card name to the record of its first matching row in card_data."""
+    first_rows = card_data.drop_duplicates(subset='Name', keep='first')
+    return {record['Name']: record for record in first_rows.to_dict('records')}
+
+# Keywords the engine asks about by name. has_keyword answers these from a bitmask
+# of the card's printed and ability keywords, built on first use
+KEYWORD_BITS: Dict[str, int] = {
+    keyword: 1 << bit for bit, keyword in enumerate((
+        'Bodyguard', 'Challenger', 'Evasive', 'Reckless', 'Resist', 'Rush',
+        'Shift', 'Singer', 'Support', 'Vanish', 'Ward',
+    ))
+}
+
+def _card_stat(value: Any) -> Optional[int]:
+    """Normalizes a numeric stat from card data to an int, or None when it is missing or not a number."""
+    if value is None or pd.isna(value):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+# Parsed schema_abilities and their removal flags keyed by the JSON text, shared by
+# every card printed with it
+_ABILITIES_BY_JSON: Dict[str, Tuple[List[Any], Tuple[bool, bool]]] = {}
+
+def _removal_flags(abilities: List[Any]) -> Tuple[bool, bool]:
+    """Returns (banishes an item, banishes a character) from the ability text."""
+    abilities_text = str(abilities).lower() if abilities else ''
+    return "banish an item" in abilities_text, "banish a character" in abilities_text
+
 class Card:
     """Represents a single instance of a card within a game."""
+    # Every card field lives in a slot, with no per-instance __dict__
+    __slots__ = (
+        'unique_id', 'name', 'cost', 'inkable', 'lore', 'card_type', 'song', 'keywords', 'abilities',
+        '_removal_flags', '_removal_flags_source', 'owner_player_id', 'is_exerted', 'damage_counters',
+        'location', 'turn_played', '_base_strength', 'willpower', 'strength_modifiers',
+        'keyword_modifiers', '_keyword_bits', '_keyword_values', '_keyword_multiplier_dirty', '_cached_kw_mult',
+    )
+
     @safe_operation(log_level='error')
     def __init__(self, card_data: Dict[str, Any], owner_player_id: int):
         # Generate a unique ID if not provided
@@ -25,13 +69,17 @@ class Card:
         self.name = card_data.get('Name', 'Unnamed Card')
         self.cost = card_data.get('Cost', 0)
         self.inkable = card_data.get('Inkable', False)
-        self.lore = card_data.get('Lore', 0)
+        self.lore: int = _card_stat(card_data.get('Lore')) or 0
         self.card_type = card_data.get('Type', 'Character') # Character, Action, Item
+        self.song = self.card_type == 'Song'
         
         # Initialize keywords from data
         self._initialize_keywords(card_data.get('Keywords'))
         
-        # Initialize abilities from data
+        # Initialize abilities from data; removal tech flags for the inkwell heuristic
+        # come with the parsed JSON, or are scanned on first use for other ability lists
+        self._removal_flags = (False, False)
+        self._removal_flags_source = None
         self._initialize_abilities(card_data.get('schema_abilities', '[]'))
         
         # Set remaining attributes
@@ -40,10 +88,22 @@ class Card:
         self.damage_counters = 0
         self.location = 'deck'
         self.turn_played: Optional[int] = None
-        self._base_strength: Optional[int] = card_data.get('Strength')
-        self.willpower: Optional[int] = card_data.get('Willpower')
+        # Stats are ints; characters always have both, other cards keep None for a missing stat
+        self._base_strength: Optional[int] = _card_stat(card_data.get('Strength'))
+        self.willpower: Optional[int] = _card_stat(card_data.get('Willpower'))
+        if self.card_type == 'Character':
+            self._base_strength = self._base_strength or 0
+            self.willpower = self.willpower or 0
         self.strength_modifiers: List[Dict[str, Any]] = []
         self.keyword_modifiers: List[Dict[str, Any]] = []
+        # has_keyword caches a KEYWORD_BITS mask, get_keyword_value caches parsed values,
+        # and board evaluation caches the product
+        # of the keyword multipliers; anything that changes keywords or keyword_modifiers
+        # must call mark_keywords_changed
+        self._keyword_bits: Optional[int] = None
+        self._keyword_values: Optional[Dict[str, Optional[int]]] = None
+        self._keyword_multiplier_dirty = True
+        self._cached_kw_mult = 1.0
     
     @safe_operation(default_return=set(), log_level='debug')
     def _initialize_keywords(self, keywords_data) -> set:
@@ -60,15 +120,30 @@ class Card:
     def _initialize_abilities(self, schema_abilities_data) -> List[Dict[str, Any]]:
         """Initialize abilities from card data"""
         if isinstance(schema_abilities_data, str):
-            try:
-                self.abilities = json.loads(schema_abilities_data)
-            except json.JSONDecodeError:
-                logger.debug(f"Failed to parse abilities JSON for card {self.name}")
-                self.abilities = []
+            # Every copy of a card carries the same JSON text; parse it once and share the
+            # (read-only) ability dicts, giving each card its own list
+            cached = _ABILITIES_BY_JSON.get(schema_abilities_data)
+            if cached is None:
+                try:
+                    parsed = json.loads(schema_abilities_data)
+                except json.JSONDecodeError:
+                    logger.debug(f"Failed to parse abilities JSON for card {self.name}")
+                    parsed = []
+                for ability in parsed:
+                    if isinstance(ability, dict):
+                        assign_effect_id(ability)
+                cached = _ABILITIES_BY_JSON[schema_abilities_data] = (parsed, _removal_flags(parsed))
+            parsed, self._removal_flags = cached
+            self.abilities = list(parsed)
+            self._removal_flags_source = self.abilities
+            return self.abilities
         elif isinstance(schema_abilities_data, list):
             self.abilities = schema_abilities_data
         else:
             self.abilities = []
+        for ability in self.abilities:
+            if isinstance(ability, dict):
+                assign_effect_id(ability)
         return self.abilities
 
     def __repr__(self) -> str:
@@ -80,18 +155,67 @@ class Card:
 
     @property
     def strength(self) -> Optional[int]:
-        if self._base_strength is None:
-            return None
+        # Summed on each read because effects and callers append to strength_modifiers
+        # directly; most cards have none, so that case returns the base straight away
+        modifiers = self.strength_modifiers
+        if not modifiers or self._base_strength is None:
+            return self._base_strength
         total_strength = self._base_strength
-        for modifier in self.strength_modifiers:
+        for modifier in modifiers:
             total_strength += modifier.get('value', 0)
         return total_strength
 
+    def _current_removal_flags(self) -> Tuple[bool, bool]:
+        # Rescanned only when abilities has been reassigned since the flags were taken
+        if self._removal_flags_source is not self.abilities:
+            self._removal_flags = _removal_flags(self.abilities)
+            self._removal_flags_source = self.abilities
+        return self._removal_flags
+
+    @property
+    def banishes_item(self) -> bool:
+        return self._current_removal_flags()[0]
+
+    @property
+    def banishes_character(self) -> bool:
+        return self._current_removal_flags()[1]
+
+    def mark_keywords_changed(self):
+        """Drops the cached keyword mask, values and multiplier after keywords or keyword_modifiers change."""
+        self._keyword_bits = None
+        self._keyword_values = None
+        self._keyword_multiplier_dirty = True
+
+    def _compute_keyword_bits(self) -> int:
+        """Builds the KEYWORD_BITS mask from base keywords (prefix match) and ability keywords."""
+        base_keywords = [kw.lower() for kw in self.keywords]
+        ability_keywords = set()
+        for ability in self.abilities:
+            value = ability.get('value') if isinstance(ability, dict) else getattr(ability, 'value', None)
+            if isinstance(value, dict):
+                ability_keywords.add(value.get('keyword'))
+
+        bits = 0
+        for keyword, bit in KEYWORD_BITS.items():
+            prefix = keyword.lower()
+            if keyword in ability_keywords or any(kw.startswith(prefix) for kw in base_keywords):
+                bits |= bit
+        return bits
+
     @safe_operation(default_return=False, log_level='debug')
     def has_keyword(self, keyword: str) -> bool:
         """Checks if a card has a specific keyword ability, including temporary ones."""
         if not keyword:
             return False
+
+        bit = KEYWORD_BITS.get(keyword)
+        if bit is not None:
+            bits = self._keyword_bits
+            if bits is None:
+                bits = self._keyword_bits = self._compute_keyword_bits()
+            if bits & bit:
+                return True
+            return any(modifier.get('keyword') == keyword for modifier in self.keyword_modifiers)
             
         # Check base keywords
         if any(kw.lower().startswith(keyword.lower()) for kw in self.keywords):
@@ -120,7 +244,18 @@ class Card:
         """Get the numeric value associated with a keyword (e.g., Challenger +X, Shift X)."""
         if not keyword:
             return None
-            
+
+        # Parsed once per keyword until the card's keywords change
+        values = self._keyword_values
+        if values is None:
+            values = self._keyword_values = {}
+        elif keyword in values:
+            return values[keyword]
+        value = values[keyword] = self._parse_keyword_value(keyword)
+        return value
+
+    def _parse_keyword_value(self, keyword: str) -> Optional[int]:
+        """Parses a keyword's value from the base keywords, then from ability schemas."""
         # Check base keywords list
         for kw_string in self.keywords:
             if kw_string.lower().startswith(keyword.lower()):
@@ -155,52 +290,68 @@ class Card:
         if amount < 0:
             logger.warning(f"Attempted to apply negative damage {amount} to {self.name}")
             amount = 0
-            
+        if not amount:
+            return self.damage_counters
+
         self.damage_counters += amount
-        logger.debug(f"{self.name} took {amount} damage, total: {self.damage_counters}")
+        # Lazy formatting: challenges deal damage constantly and debug logging is normally off
+        logger.debug("%s took %d damage, total: %d", self.name, amount, self.damage_counters)
         return self.damage_counters
 
 class Deck:
-    """Represents a player's deck of 60 cards."""
-    def __init__(self, card_list: List[Card]):
+    """Represents a player's deck of 60 cards. The end of the card list is the top of the deck."""
+    __slots__ = ('cards',)
+
+    def __init__(self, card_list: List[Card], rng: Optional[np.random.Generator] = None):
         self.cards = card_list
-        self.shuffle()
+        self.shuffle(rng)
 
-    def shuffle(self):
-        random.shuffle(self.cards)
+    def shuffle(self, rng: Optional[np.random.Generator] = None):
+        """Shuffles with the given generator, or the module's shared one when none is given."""
+        cards = self.cards
+        order = (rng if rng is not None else _RNG).permutation(len(cards))
+        self.cards = [cards[i] for i in order.tolist()]
 
     def draw(self) -> Optional[Card]:
-        return self.cards.pop(0) if self.cards else None
+        # Drawing from the end is O(1); the shuffled order is equally random from either end
+        return self.cards.pop() if self.cards else None
 
     def is_empty(self) -> bool:
         return not self.cards
 
 class Player:
     """Represents a player in the game, including their actions."""
-    def __init__(self, player_id: int, initial_deck: Optional[Deck] = None, deck_list: Optional[List[str]] = None, card_data: Optional[pd.DataFrame] = None):
+    __slots__ = (
+        'player_id', 'deck', 'hand', 'inkwell', 'play_area', 'discard_pile', 'locations', 'lore',
+        'has_inked_this_turn', 'temporary_strength_mods', 'game',
+    )
+
+    def __init__(self, player_id: int, initial_deck: Optional[Deck] = None, deck_list: Optional[List[str]] = None, card_data: Optional[pd.DataFrame] = None,
+                 card_index: Optional[Dict[str, Dict[str, Any]]] = None, rng: Optional[np.random.Generator] = None):
         """
         Initializes a Player.
 
         Can be initialized in two ways:
         1. With a pre-made Deck object.
-        2. With a list of card names and a pandas DataFrame containing all card data.
+        2. With a list of card names and either a pandas DataFrame containing all card data
+           or a name -> record index built once with build_card_index. The deck is
+           shuffled with rng when one is given.
         """
         self.player_id = player_id
         
         if initial_deck is not None:
             self.deck = initial_deck
-        elif deck_list is not None and card_data is not None:
+        elif deck_list is not None and (card_index is not None or card_data is not None):
+            if card_index is None:
+                card_index = build_card_index(card_data)
             card_objects = []
             for card_name in deck_list:
-                # Find all rows that match the card name
-                card_data_rows = card_data[card_data['Name'] == card_name]
-                if not card_data_rows.empty:
-                    # Use the first match
-                    card_info = card_data_rows.iloc[0].to_dict()
+                card_info = card_index.get(card_name)
+                if card_info is not None:
                     card_objects.append(Card(card_info, owner_player_id=self.player_id))
                 else:
                     logger.warning(f"Card '{card_name}' not found in dataset. Skipping.")
-            self.deck = Deck(card_objects)
+            self.deck = Deck(card_objects, rng)
         else:
             # If no deck information is provided, initialize with an empty deck.
             # This is useful for testing purposes.
@@ -242,10 +393,12 @@ class Player:
         """Checks if a character can perform an action (ink is 'dry')."""
         if character.is_exerted:
             return False
-        if character.has_keyword('Rush'):
+        # A character's ink is 'wet' on the turn it is played; checking that first leaves
+        # the Rush lookup for the few characters played this turn
+        turn_played = character.turn_played
+        if turn_played is None or turn_played < game_turn:
             return True
-        # A character's ink is 'wet' on the turn it is played
-        return character.turn_played is None or character.turn_played < game_turn
+        return character.has_keyword('Rush')
 
     def ink_card(self, card: Card) -> bool:
         """Moves a card from hand to inkwell. Returns True on success."""
@@ -253,9 +406,11 @@ class Player:
             return False
         if not card.inkable:
             return False
-        if card not in self.hand:
-            raise ValueError("Card to be inked is not in the player's hand.")
-        self.hand.remove(card)
+        # remove() both checks membership and removes, in one scan of the hand
+        try:
+            self.hand.remove(card)
+        except ValueError:
+            raise ValueError("Card to be inked is not in the player's hand.") from None
         self.inkwell.append(card)
         card.location = 'inkwell'
         card.is_exerted = True
@@ -264,13 +419,11 @@ class Player:
 
     def exert_ink(self, amount: int):
         """Exerts a specified number of ready ink cards."""
-        if self.get_available_ink() < amount:
-            raise ValueError(f"Not enough available ink. Have {self.get_available_ink()}, need {amount}")
-        ink_to_exert = amount
-        for ink_card in self.inkwell:
-            if not ink_card.is_exerted and ink_to_exert > 0:
-                ink_card.is_exerted = True
-                ink_to_exert -= 1
+        ready_ink = [ink_card for ink_card in self.inkwell if not ink_card.is_exerted]
+        if len(ready_ink) < amount:
+            raise ValueError(f"Not enough available ink. Have {len(ready_ink)}, need {amount}")
+        for ink_card in ready_ink[:amount]:
+            ink_card.is_exerted = True
 
     def get_possible_shift_targets(self, card: 'Card') -> List['Card']:
         """Returns a list of characters in play that the given card can be shifted onto."""
@@ -281,8 +434,11 @@ class Player:
 
     def play_card(self, card: 'Card', game: 'GameState', shift_target: Optional['Card'] = None, chosen_targets: Optional[List['Card']] = None):
         """Plays a card from hand, handling normal, item, action, and shift plays."""
-        if card not in self.hand:
-            raise ValueError(f"Card {card.name} not in hand.")
+        # Find the card once; its position is reused to remove it after paying
+        try:
+            hand_index = self.hand.index(card)
+        except ValueError:
+            raise ValueError(f"Card {card.name} not in hand.") from None
 
         cost = card.cost
         if shift_target:
@@ -291,21 +447,28 @@ class Player:
                 raise ValueError(f"Card {card.name} does not have a valid Shift cost.")
             cost = shift_cost
 
-        if self.get_available_ink() < cost:
-            raise ValueError(f"Not enough ink to play {card.name}. Have {self.get_available_ink()}, need {cost}.")
+        available_ink = self.get_available_ink()
+        if available_ink < cost:
+            raise ValueError(f"Not enough ink to play {card.name}. Have {available_ink}, need {cost}.")
 
         self.exert_ink(cost)
-        self.hand.remove(card)
+        del self.hand[hand_index]
 
         if shift_target:
-            if shift_target not in self.play_area:
-                raise ValueError(f"Shift target {shift_target.name} is not in play.")
+            try:
+                target_index = self.play_area.index(shift_target)
+            except ValueError:
+                raise ValueError(f"Shift target {shift_target.name} is not in play.") from None
             card.is_exerted = shift_target.is_exerted
             card.damage_counters = shift_target.damage_counters
-            card.strength_modifiers = list(shift_target.strength_modifiers)
-            card.keyword_modifiers = list(shift_target.keyword_modifiers)
+            # Modifier lists are usually empty on both cards; only copy when there is something to carry over
+            if shift_target.strength_modifiers or card.strength_modifiers:
+                card.strength_modifiers = list(shift_target.strength_modifiers)
+            if shift_target.keyword_modifiers or card.keyword_modifiers:
+                card.keyword_modifiers = list(shift_target.keyword_modifiers)
+                card.mark_keywords_changed()
             card.turn_played = shift_target.turn_played
-            self.play_area.remove(shift_target)
+            del self.play_area[target_index]
             self.discard_pile.append(shift_target)
             shift_target.location = 'discard'
             card.location = 'play_area'
@@ -397,22 +560,26 @@ class Player:
 
     def return_to_hand(self, character: Card):
         """Moves a character from the play area back to the owner's hand."""
-        if character in self.play_area:
+        try:
             self.play_area.remove(character)
-            character.location = 'hand'
-            self.hand.append(character)
+        except ValueError:
+            return
+        character.location = 'hand'
+        self.hand.append(character)
 
     def banish_character(self, character: Card):
         """Moves a character from play. If it has Vanish, it returns to hand; otherwise, to discard."""
-        if character in self.play_area:
+        try:
             self.play_area.remove(character)
-            if character.has_keyword('Vanish'):
-                character.location = 'hand'
-                character.damage_counters = 0
-                self.hand.append(character)
-            else:
-                character.location = 'discard'
-                self.discard_pile.append(character)
+        except ValueError:
+            return
+        if character.has_keyword('Vanish'):
+            character.location = 'hand'
+            character.damage_counters = 0
+            self.hand.append(character)
+        else:
+            character.location = 'discard'
+            self.discard_pile.append(character)
 
     def activate_ability(self, card: Card, ability_index: int, game: 'GameState') -> bool:
         """Activates a card's ability. Returns True on success."""
@@ -429,23 +596,21 @@ class Player:
 
     def get_valid_challenge_targets(self, challenger: Card, opponent: 'Player') -> list[Card]:
         """Returns a list of valid characters the given character can challenge."""
-        # First check for bodyguards (they must be challenged first if present)
-        bodyguard_targets = [char for char in opponent.play_area if char.is_exerted and char.has_keyword('Bodyguard')]
-        if bodyguard_targets:
-            return self._filter_invalid_challenge_targets(challenger, bodyguard_targets)
-            
-        # Find all valid targets based on game rules
+        # One pass over the opponent's board: exerted bodyguards must be challenged first if
+        # present, otherwise Evasive targets need an Evasive challenger
+        bodyguard_targets = []
         valid_targets = []
         challenger_has_evasive = challenger.has_keyword('Evasive')
         for target in opponent.play_area:
             if not target.is_exerted:
                 continue
-            if target.has_keyword('Evasive') and not challenger_has_evasive:
-                continue
-            valid_targets.append(target)
-            
+            if target.has_keyword('Bodyguard'):
+                bodyguard_targets.append(target)
+            elif not bodyguard_targets and (challenger_has_evasive or not target.has_keyword('Evasive')):
+                valid_targets.append(target)
+
         # Filter out invalid targets (e.g., self-challenge)
-        return self._filter_invalid_challenge_targets(challenger, valid_targets)
+        return self._filter_invalid_challenge_targets(challenger, bodyguard_targets or valid_targets)
         
     def _filter_invalid_challenge_targets(self, challenger: Card, targets: list[Card]) -> list[Card]:
         """Filters out invalid challenge targets (e.g., self-challenge, same name, or Location)."""
@@ -467,7 +632,11 @@ class Player:
 
 class GameState:
     """Manages the entire state and flow of a Lorcana game."""
-    
+    __slots__ = (
+        'players', '_opponent_of', 'turn_number', 'current_player_id', 'initial_player_id', 'winner',
+        'effect_resolver', 'trigger_bag',
+    )
+
     @safe_operation(log_level='error')
     def __init__(self, player1: Player, player2: Player):
         """Initialize the game state with two players."""
@@ -475,6 +644,8 @@ class GameState:
             1: player1,
             2: player2
         }
+        # Seat id -> the other seat's player, so get_opponent is a single lookup
+        self._opponent_of = {1: player2, 2: player1}
         self.players[1].game = self
         self.players[2].game = self
         self.turn_number = 1
@@ -490,17 +661,23 @@ class GameState:
 
     def get_opponent(self, player_id: int) -> Player:
         """Gets the opponent of a given player."""
-        return self.players[2 if player_id == 1 else 1]
+        return self._opponent_of[player_id]
 
     @safe_operation(default_return=False, log_level='debug')
     def _check_for_winner(self) -> bool:
         """Checks win conditions: lore count and decking out."""
-        # Check lore win condition
-        for player_id, player in self.players.items():
-            if player.lore >= 20:
-                self.winner = player_id
-                logger.info(f"Player {player_id} has reached 20 lore and won the game!")
-                return True
+        # Check lore win condition; there are always exactly two seats, so check them directly
+        lore_to_win = player_logic.LORE_TO_WIN
+        if self.players[1].lore >= lore_to_win:
+            lore_winner = 1
+        elif self.players[2].lore >= lore_to_win:
+            lore_winner = 2
+        else:
+            lore_winner = None
+        if lore_winner is not None:
+            self.winner = lore_winner
+            logger.info(f"Player {lore_winner} has reached {lore_to_win} lore and won the game!")
+            return True
         # Check deck-out win condition
         for player_id, player in self.players.items():
             if player.deck.is_empty() and not any(card.location == 'hand' for card in player.hand):
@@ -566,19 +743,25 @@ class GameState:
 
         # Calculate effective strength for the challenge
         challenger_strength = challenger.strength or 0
-        challenger_strength += challenger_player.temporary_strength_mods.get(challenger.unique_id, 0)
+        # Support bonuses are rare, so skip the lookup while none are active this turn
+        temporary_mods = challenger_player.temporary_strength_mods
+        if temporary_mods:
+            challenger_strength += temporary_mods.get(challenger.unique_id, 0)
 
         target_strength = target.strength or 0
 
-        # Challenger keyword bonus
-        challenger_bonus = challenger.get_keyword_value('Challenger')
-        if challenger_bonus:
-            challenger_strength += challenger_bonus
+        # Challenger keyword bonus; the has_keyword bitmask check skips the keyword text scan
+        # for the usual case of a card without the keyword
+        if challenger.has_keyword('Challenger'):
+            challenger_bonus = challenger.get_keyword_value('Challenger')
+            if challenger_bonus:
+                challenger_strength += challenger_bonus
 
         # Resist keyword reduction
-        resist_value = target.get_keyword_value('Resist')
-        if resist_value:
-            challenger_strength = max(0, challenger_strength - resist_value)
+        if target.has_keyword('Resist'):
+            resist_value = target.get_keyword_value('Resist')
+            if resist_value:
+                challenger_strength = max(0, challenger_strength - resist_value)
 
         # Deal damage
         if target_strength > 0:
@@ -670,22 +853,3 @@ class GameState:
         else:
             logger.info("Game ended in a draw!")
             return None # Draw
-        if bodyguard_targets:
-            return bodyguard_targets
-
-        # Evasive rule: Characters with Evasive can only be challenged by other characters with Evasive.
-        valid_targets = []
-        challenger_has_evasive = challenger.has_keyword('Evasive')
-
-        for target in opponent.play_area:
-            if not target.is_exerted:
-                continue  # Can only challenge exerted characters
-
-            if target.has_keyword('Evasive'):
-                if challenger_has_evasive:
-                    valid_targets.append(target)
-            else:
-                # Non-evasive characters can be challenged by anyone
-                valid_targets.append(target)
-
-        return valid_targets
@@ -1,16 +1,26 @@
 from typing import List, Optional, Any, Tuple
 from abc import ABC, abstractmethod
+from operator import attrgetter
 
 # To avoid circular imports, we'll use string type hints for game engine classes
 # and import them only for type checking if necessary.
 from typing import TYPE_CHECKING
-from .advanced_heuristics import evaluate_board_state, evaluate_inkwell_candidate, perform_lookahead_analysis
+from .advanced_heuristics import score_actions, max_ready_strength
 if TYPE_CHECKING:
     from .game_engine import Card, GameState, Player
 
+# Lookahead score for a challenge, indexed by (attacker banishes defender) << 1 | (attacker survives):
+# the defender surviving is a bad trade, both banished is even, only the defender banished is good
+CHALLENGE_TRADE_SCORES = (-3.0, -3.0, 1.0, 4.0)
+
+# Lore a player needs to win; questing is the usual way to reach it
+LORE_TO_WIN = 20
+
 # --- Action Abstraction ---
 class Action(ABC):
     """Abstract base class for any action a player can take."""
+    __slots__ = ('score',)
+
     def __init__(self, score: float = 0.0):
         self.score = score
 
@@ -18,10 +28,20 @@ class Action(ABC):
     def execute(self, game: 'GameState', player: 'Player'):
         pass
 
+    def immediate_score(self, game: 'GameState', player: 'Player', opponent_threat: Optional[int] = None) -> float:
+        """Quick depth-1 score used by the lookahead pass before the detailed heuristics.
+
+        opponent_threat is the highest strength among the opponent's ready characters,
+        or None if they have none.
+        """
+        return 0.0
+
     def __repr__(self):
         return f"{self.__class__.__name__}" # Score is transient, not part of identity
 
 class InkAction(Action):
+    __slots__ = ('card',)
+
     def __init__(self, card: 'Card'):
         super().__init__()
         self.card = card
@@ -29,10 +49,16 @@ class InkAction(Action):
     def execute(self, game: 'GameState', player: 'Player'):
         player.ink_card(self.card)
 
+    def immediate_score(self, game: 'GameState', player: 'Player', opponent_threat: Optional[int] = None) -> float:
+        # Value for cards with lore
+        return self.card.lore * 2.0
+
     def __repr__(self):
         return f"InkAction(card={self.card.name})"
 
 class PlayCardAction(Action):
+    __slots__ = ('card', 'shift_target')
+
     def __init__(self, card: 'Card', shift_target: Optional['Card'] = None):
         super().__init__()
         self.card = card
@@ -41,24 +67,44 @@ class PlayCardAction(Action):
     def execute(self, game: 'GameState', player: 'Player'):
         player.play_card(self.card, game, shift_target=self.shift_target)
 
+    def immediate_score(self, game: 'GameState', player: 'Player', opponent_threat: Optional[int] = None) -> float:
+        # Value for cards with lore
+        return self.card.lore * 2.0
+
     def __repr__(self):
         if self.shift_target:
             return f"PlayCardAction(card={self.card.name}, shift_on={self.shift_target.name})"
         return f"PlayCardAction(card={self.card.name})"
 
 class QuestAction(Action):
+    __slots__ = ('character', 'support_target')
+
     def __init__(self, character: 'Card', support_target: Optional['Card'] = None):
         super().__init__()
         self.character = character
         self.support_target = support_target
 
     def execute(self, game: 'GameState', player: 'Player'):
-        player.quest(self.character, game.turn_number, self.support_target)
+        # Quests are where lore changes, so the lore win is settled here rather than by
+        # rescanning every player after each action
+        if player.quest(self.character, game.turn_number, self.support_target) and player.lore >= LORE_TO_WIN:
+            game.winner = player.player_id
+
+    def immediate_score(self, game: 'GameState', player: 'Player', opponent_threat: Optional[int] = None) -> float:
+        # Value based on lore gained
+        score = self.character.lore * 3.0
+
+        # Check if the character would be vulnerable to challenges after questing
+        if opponent_threat is not None and opponent_threat >= self.character.willpower:
+            score -= 2.0  # Penalty for being vulnerable
+        return score
 
     def __repr__(self):
         return f"QuestAction(character={self.character.name})"
 
 class ChallengeAction(Action):
+    __slots__ = ('attacker', 'defender')
+
     def __init__(self, attacker: 'Card', defender: 'Card'):
         super().__init__()
         self.attacker = attacker
@@ -67,10 +113,18 @@ class ChallengeAction(Action):
     def execute(self, game: 'GameState', player: 'Player'):
         game.challenge(self.attacker, self.defender)
 
+    def immediate_score(self, game: 'GameState', player: 'Player', opponent_threat: Optional[int] = None) -> float:
+        # Value based on the trade, using current stats; index by (attacker banishes defender, attacker survives)
+        attacker, defender = self.attacker, self.defender
+        trade = ((attacker.strength >= defender.willpower) << 1) | (defender.strength < attacker.willpower)
+        return CHALLENGE_TRADE_SCORES[trade]
+
     def __repr__(self):
         return f"ChallengeAction(attacker={self.attacker.name}, defender={self.defender.name})"
 
 class SingAction(Action):
+    __slots__ = ('song_card', 'singer')
+
     def __init__(self, song_card: 'Card', singer: 'Card'):
         super().__init__()
         self.song_card = song_card
@@ -83,6 +137,8 @@ class SingAction(Action):
         return f"SingAction(song={self.song_card.name}, singer={self.singer.name})"
 
 class ActivateAbilityAction(Action):
+    __slots__ = ('card', 'ability_index')
+
     def __init__(self, card: 'Card', ability_index: int):
         super().__init__()
         self.card = card
@@ -91,6 +147,10 @@ class ActivateAbilityAction(Action):
     def execute(self, game: 'GameState', player: 'Player'):
         player.activate_ability(self.card, self.ability_index, game.turn_number)
 
+    def immediate_score(self, game: 'GameState', player: 'Player', opponent_threat: Optional[int] = None) -> float:
+        # Value for cards with lore
+        return self.card.lore * 2.0
+
     def __repr__(self):
         return f"ActivateAbilityAction(card={self.card.name}, ability_index={self.ability_index})"
 
@@ -101,16 +161,13 @@ def evaluate_actions(actions: List[Action], game: 'GameState', player: 'Player')
     Scores each possible action based on a comprehensive set of heuristics.
     This is the core 'brain' of the AI.
     """
-    # First, get the baseline board evaluation to compare against
-    baseline_score = evaluate_board_state(game, player.player_id)
-    
-    # Use lookahead analysis for initial scoring
-    scored_actions = perform_lookahead_analysis(game, player, actions)
-    
-    # Update the action scores
-    for action, score in scored_actions:
-        action.score = score
+    # Start every action from its immediate score on the current board
+    score_actions(game, player, actions)
     
+    # Strongest ready opponent character and our ready ink, scanned once for all actions
+    opponent_threat = max_ready_strength(game.get_opponent(player.player_id).play_area)
+    available_ink = player.get_available_ink()
+
     # Add more detailed heuristics for each action type
     for action in actions:
         if isinstance(action, QuestAction):
@@ -121,15 +178,9 @@ def evaluate_actions(actions: List[Action], game: 'GameState', player: 'Player')
                 score += 1.5
 
             # Risk assessment: check if questing makes the character vulnerable to banishment
-            opponent = game.get_opponent(player.player_id)
-            character_at_risk = action.character
-            for opponent_char in opponent.play_area:
-                if (opponent_char.card_type == 'Character' and 
-                    not opponent_char.is_exerted and 
-                    opponent_char.strength >= character_at_risk.willpower):
-                    # Character could be banished by a challenge; major penalty
-                    score -= 3
-                    break
+            if opponent_threat is not None and opponent_threat >= action.character.willpower:
+                # Character could be banished by a challenge; major penalty
+                score -= 3
             
             # Higher bonus for questing when close to winning
             if player.lore + score >= 20:  # Would win the game
@@ -176,8 +227,7 @@ def evaluate_actions(actions: List[Action], game: 'GameState', player: 'Player')
                     # Count songs in hand that this character could sing
                     singer_value = card.get_keyword_value('Singer') or 0
                     eligible_songs = sum(1 for c in player.hand 
-                                        if c.card_type == 'Action' and 
-                                        hasattr(c, 'song') and c.song and 
+                                        if c.card_type == 'Action' and c.song and 
                                         c.cost <= singer_value)
                     score += eligible_songs * 0.8
 
@@ -196,7 +246,7 @@ def evaluate_actions(actions: List[Action], game: 'GameState', player: 'Player')
                 score = 3.5
                 
                 # Songs are valued differently
-                if hasattr(card, 'song') and card.song:
+                if card.song:
                     # Check if we have singers to use it
                     singers = [c for c in player.play_area 
                               if c.card_type == 'Character' and 
@@ -208,7 +258,7 @@ def evaluate_actions(actions: List[Action], game: 'GameState', player: 'Player')
             
             elif card.card_type == 'Location':
                 # Locations with lore are very valuable
-                if hasattr(card, 'lore') and card.lore > 0:
+                if card.lore > 0:
                     score = card.lore * 3.5
                 else:
                     score = 2.5
@@ -295,11 +345,11 @@ def evaluate_actions(actions: List[Action], game: 'GameState', player: 'Player')
             score -= play_score
 
             # Bonus for inking a card that is currently unplayable anyway.
-            if card_to_ink.cost > player.get_available_ink():
+            if card_to_ink.cost > available_ink:
                 score += 3
 
             # Penalty for inking a card we could play this turn.
-            if card_to_ink.cost <= player.get_available_ink():
+            if card_to_ink.cost <= available_ink:
                 score -= 5
 
             action.score = score
@@ -346,16 +396,17 @@ def get_possible_actions(game: 'GameState', player: 'Player', has_inked: bool) -
             actions.append(InkAction(inkable_cards[0]))
 
     # 2. Play card actions (Normal and Shift)
+    # Nothing is exerted while enumerating, so the ready ink count holds for the whole hand
     available_ink = player.get_available_ink()
     for card in player.hand:
         # Normal play
-        if player.can_play_card(card):
+        if card.cost <= available_ink:
             actions.append(PlayCardAction(card))
 
         # Shift play
         if card.has_keyword('Shift'):
             shift_cost = card.get_keyword_value('Shift')
-            if shift_cost is not None and player.get_available_ink() >= shift_cost:
+            if shift_cost is not None and available_ink >= shift_cost:
                 shift_targets = player.get_possible_shift_targets(card)
                 for target in shift_targets:
                     actions.append(PlayCardAction(card, shift_target=target))
@@ -424,10 +475,10 @@ def get_possible_actions(game: 'GameState', player: 'Player', has_inked: bool) -
 
     return actions
 
-from src.utils.logger import get_logger
+from src.utils.logger import get_simulation_logger
 
 # Get the logger instance
-logger = get_logger()
+logger = get_simulation_logger()
 
 MAX_ACTIONS_PER_TURN = 30  # Safety break to prevent infinite loops in AI
 
@@ -463,8 +514,8 @@ def run_main_phase(game: 'GameState', player: 'Player'):
         for action in possible_actions:
             logger.debug(f"Action {repr(action)} has score {action.score}")
             
-        possible_actions.sort(key=lambda a: a.score, reverse=True)
-        best_action = possible_actions[0]
+        # Ties go to the action enumerated first
+        best_action = max(possible_actions, key=attrgetter('score'))
         logger.debug(f"Selected best action: {repr(best_action)} with score {best_action.score}")
 
         # Check if the best action is a challenge with a reckless character
@@ -487,6 +538,8 @@ def run_main_phase(game: 'GameState', player: 'Player'):
         best_action.execute(game, player)
         executed_actions_this_turn.add(repr(best_action))  # Record the action
         actions_taken_count += 1
+        if game.winner:
+            break
 
         if isinstance(best_action, InkAction):
             has_inked_this_turn = True
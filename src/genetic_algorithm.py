@@ -4,7 +4,7 @@ import numpy as np
 import time
 from typing import List, Dict, Any, Optional, Tuple, Callable, Union
 from src.deck_generator import DeckGenerator
-from src.evolution import FitnessCalculator
+from src.evolution import FitnessCalculator, DeckBuildError
 from src.deck_analyzer import DeckAnalyzer
 from src.utils.logger import get_logger
 from src.utils.error_handler import safe_operation
@@ -12,6 +12,11 @@ from src.utils.error_handler import safe_operation
 # Get the logger instance
 logger = get_logger()
 
+# Fitness given to decks that cannot be built. Real fitness is a win rate in [0, 1],
+# so this ranks below every buildable deck; it stays finite because pygad sums and
+# normalizes fitness values in some selection types, where -inf would turn into NaN.
+UNBUILDABLE_DECK_FITNESS = -1.0
+
 class GeneticAlgorithm:
     """Manages the genetic algorithm process for evolving Lorcana decks."""
 
@@ -184,9 +189,14 @@ class GeneticAlgorithm:
         # Convert solution (card IDs) to actual card names before fitness calculation
         card_names = [self.deck_generator.id_to_card[gene] for gene in solution]
         
-        # Now pass the card names to the fitness calculator
-        fitness, detailed_results = self.fitness_calculator.calculate_fitness(
-            card_names, self.max_turns_per_game)
+        # Now pass the card names to the fitness calculator. Decks that can't be
+        # built rank below every real deck rather than being scored as weak decks.
+        try:
+            fitness, detailed_results = self.fitness_calculator.calculate_fitness(
+                card_names, max_turns=self.max_turns_per_game)
+        except DeckBuildError as e:
+            logger.warning(f"Excluding solution {solution_idx}: {e}")
+            return UNBUILDABLE_DECK_FITNESS
         
         # Store detailed results for the best solution (for analysis later)
         if fitness > self.best_solution_fitness:
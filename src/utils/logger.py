@@ -85,6 +85,16 @@ def get_logger() -> logging.Logger:
         logger = setup_logger()
     return logger
 
+def get_simulation_logger() -> logging.Logger:
+    """
+    Get the child logger used by the game engine, so per-game logging can be
+    quieted without changing the level of the shared logger.
+    
+    Returns:
+        The "simulation" child of the global logger
+    """
+    return get_logger().getChild('simulation')
+
 # Helper functions for different log levels
 def debug(message: str, *args, **kwargs) -> None:
     get_logger().debug(message, *args, **kwargs)
@@ -0,0 +1,47 @@
+import random
+import unittest
+
+import pandas as pd
+
+from src.game_engine import game_engine
+from src.game_engine.game_engine import build_card_index
+from src.game_engine.batch import simulate_game, simulate_games
+
+
+class TestBatchSimulation(unittest.TestCase):
+    def setUp(self):
+        """Set up a small card pool and two mirrored decks."""
+        card_data = pd.DataFrame([
+            {'Name': f'Card {i}', 'Cost': 1 + i % 4, 'Inkable': i % 3 != 0, 'Type': 'Character',
+             'Strength': 1 + i % 3, 'Willpower': 2 + i % 2, 'Lore': 1 + i % 2, 'schema_abilities': '[]'}
+            for i in range(8)
+        ])
+        self.card_index = build_card_index(card_data)
+        self.deck1 = [f'Card {i % 8}' for i in range(40)]
+        self.deck2 = [f'Card {(i * 3) % 8}' for i in range(40)]
+
+    def test_same_seed_replays_the_same_game(self):
+        """Tests that a seeded game is reproducible."""
+        first = simulate_game(7, self.deck1, self.deck2, self.card_index, max_turns=20)
+        second = simulate_game(7, self.deck1, self.deck2, self.card_index, max_turns=20)
+        self.assertEqual(first, second)
+        self.assertIn(first, (1, 2, None))
+
+    def test_batch_leaves_global_random_state_alone(self):
+        """Tests that an in-process batch does not reseed the caller's random generators."""
+        random_state = random.getstate()
+        shuffle_state = game_engine._RNG.bit_generator.state
+        simulate_games(2, self.deck1, self.deck2, self.card_index, max_turns=10, num_workers=1)
+        self.assertEqual(random.getstate(), random_state)
+        self.assertEqual(game_engine._RNG.bit_generator.state, shuffle_state)
+
+    def test_parallel_batch_matches_sequential_batch(self):
+        """Tests that spreading games over workers returns the same winners in seed order."""
+        sequential = simulate_games(6, self.deck1, self.deck2, self.card_index, max_turns=20, num_workers=1)
+        parallel = simulate_games(6, self.deck1, self.deck2, self.card_index, max_turns=20, num_workers=2)
+        self.assertEqual(len(sequential), 6)
+        self.assertEqual(parallel, sequential)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ from unittest.mock import Mock, MagicMock
 
 # Imports from the main source code
 from src.game_engine.game_engine import GameState, Player, Card
-from src.game_engine.effect_resolver import EffectResolver
+from src.game_engine.effect_resolver import EffectResolver, EffectKind, assign_effect_id
 
 
 class TestEffectResolver(unittest.TestCase):
@@ -517,6 +517,79 @@ class TestEffectResolver(unittest.TestCase):
         self.assertNotIn(card2, targets)  # Not exerted
         self.assertNotIn(card3, targets)  # Cost too high
 
+    def test_get_targets_skips_board_for_contradictory_filters(self):
+        """Test that filters no card can satisfy return no targets without reading the board."""
+        # 1. Setup
+        source_card = Mock(spec=Card)
+        source_card.owner_player_id = self.player1.player_id
+        self.game.get_player = MagicMock(return_value=self.player1)
+        self.game.get_opponent = MagicMock(return_value=self.player2)
+
+        effect_schema = {'target': 'OpponentCharacters', 'cost_equal_to': 4, 'cost_less_than': 3}
+
+        # 2. Action
+        targets = self.resolver._get_targets(effect_schema, source_card)
+
+        # 3. Assert
+        self.assertEqual(targets, [])
+        self.game.get_opponent.assert_not_called()
+
+    def test_resolve_effect_skips_player_targets(self):
+        """Test that card handlers only receive card targets when players are among the targets."""
+        # 1. Setup
+        source_card = Mock(spec=Card)
+        target_card = Mock(spec=Card)
+        target_card.take_damage = MagicMock()
+
+        schema_ability = {"effect": "DealDamage", "value": 2, "target": "ChosenCharacter"}
+
+        # 2. Action
+        self.resolver.resolve_effect(schema_ability, source_card, chosen_targets=[self.player2, target_card])
+
+        # 3. Assert
+        target_card.take_damage.assert_called_once_with(2)
+
+    def test_resolve_effect_dispatches_on_effect_id(self):
+        """Test that a pre-resolved effect_id selects the handler without the effect name."""
+        # 1. Setup
+        source_card = Mock(spec=Card)
+        target_card = Mock(spec=Card)
+        target_card.take_damage = MagicMock()
+
+        schema_ability = {"effect": "DealDamage", "value": 1, "target": "ChosenCharacter"}
+        assign_effect_id(schema_ability)
+        schema_ability["effect"] = "Unknown"
+
+        # 2. Action
+        self.resolver.resolve_effect(schema_ability, source_card, chosen_targets=[target_card])
+
+        # 3. Assert
+        self.assertEqual(schema_ability["effect_id"], EffectKind.DealDamage)
+        target_card.take_damage.assert_called_once_with(1)
+
+    def test_get_targets_reuses_compiled_predicate(self):
+        """Test that the target filter is compiled once and cached on the schema."""
+        # 1. Setup
+        source_card = Mock(spec=Card)
+        source_card.owner_player_id = self.player1.player_id
+        low_cost_card = Mock(spec=Card)
+        low_cost_card.cost = 1
+        self.player2.play_area = [low_cost_card]
+        self.game.get_player = MagicMock(return_value=self.player1)
+        self.game.get_opponent = MagicMock(return_value=self.player2)
+
+        effect_schema = {'target': 'OpponentCharacters', 'cost_less_than': 3}
+
+        # 2. Action
+        first_targets = self.resolver._get_targets(effect_schema, source_card)
+        predicate = effect_schema['_target_predicate']
+        second_targets = self.resolver._get_targets(effect_schema, source_card)
+
+        # 3. Assert
+        self.assertEqual(first_targets, [low_cost_card])
+        self.assertEqual(second_targets, [low_cost_card])
+        self.assertIs(effect_schema['_target_predicate'], predicate)
+
 
 if __name__ == '__main__':
     unittest.main()
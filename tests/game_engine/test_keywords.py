@@ -18,7 +18,6 @@ class TestKeywords(unittest.TestCase):
         # 1. Setup
         # Challenger has no keywords
         challenger = Card({'Name': 'Challenger Card', 'Type': 'Character', 'Cost': 1, 'Strength': 1, 'Willpower': 1}, owner_player_id=1)
-        challenger.can_challenge = True # Assume it can challenge this turn
         self.player1.play_area.append(challenger)
 
         # Target 1 has Evasive and is exerted
@@ -54,7 +53,6 @@ class TestKeywords(unittest.TestCase):
 
         # Now, give the challenger Evasive
         challenger_evasive = Card({'Name': 'Evasive Challenger', 'Type': 'Character', 'Cost': 1, 'Strength': 1, 'Willpower': 1, 'Keywords': ['Evasive']}, owner_player_id=1)
-        challenger_evasive.can_challenge = True # Assume it can challenge this turn
         self.player1.play_area = [challenger_evasive] # Replace the old challenger
 
         # Get valid targets for the Evasive challenger
@@ -421,6 +421,36 @@ class TestNewPlayerLogic(unittest.TestCase):
         # The character with Vanish should be considered more valuable for its late-game lore potential.
         self.assertGreater(vanish_action.score, vanilla_action.score, "Vanish keyword should increase the card's score.")
 
+    def test_challenge_immediate_score_reflects_trade(self):
+        """Tests that a challenge's lookahead score rewards winning trades and penalizes losing ones."""
+        # SETUP
+        strong_card = Card(create_mock_card_data("Strong", Strength=4, Willpower=4), self.player1.player_id)
+        weak_card = Card(create_mock_card_data("Weak", Strength=1, Willpower=1), self.player2.player_id)
+
+        # ACTION
+        winning_score = ChallengeAction(strong_card, weak_card).immediate_score(self.game, self.player1)
+        losing_score = ChallengeAction(weak_card, strong_card).immediate_score(self.game, self.player1)
+
+        # ASSERT
+        self.assertEqual(winning_score, 4.0)
+        self.assertEqual(losing_score, -3.0)
+
+    def test_questing_to_winning_lore_ends_main_phase(self):
+        """Tests that a quest reaching the lore goal declares the winner and stops the AI's turn."""
+        # SETUP
+        questers = [Card(create_mock_card_data(f"Quester{i}", Lore=2), self.player1.player_id) for i in range(2)]
+        for card in questers:
+            card.turn_played = 1
+            self.player1.play_area.append(card)
+        self.player1.lore = 19
+
+        # ACTION
+        run_main_phase(self.game, self.player1)
+
+        # ASSERT
+        self.assertEqual(self.game.winner, self.player1.player_id)
+        self.assertEqual(sum(card.is_exerted for card in questers), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,8 +9,11 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.game_engine.advanced_heuristics import (
     evaluate_board_state,
     calculate_board_presence,
+    keyword_multiplier,
     evaluate_inkwell_candidate,
-    perform_lookahead_analysis
+    max_ready_strength,
+    perform_lookahead_analysis,
+    score_actions
 )
 
 class TestAdvancedHeuristics(unittest.TestCase):
@@ -97,13 +100,29 @@ class TestAdvancedHeuristics(unittest.TestCase):
         self.assertAlmostEqual(presence, expected_value, places=5, 
                              msg="Mixed card types presence calculation incorrect")
 
+    def test_keyword_multiplier_is_cached_until_dirty(self):
+        # First call computes and caches the multiplier
+        self.assertAlmostEqual(keyword_multiplier(self.mock_character), 1.3, places=5)
+        self.assertFalse(self.mock_character._keyword_multiplier_dirty)
+        
+        # Keyword changes are not seen until the card is marked dirty
+        self.mock_character.has_keyword = lambda keyword: keyword in ('Evasive', 'Ward')
+        self.assertAlmostEqual(keyword_multiplier(self.mock_character), 1.3, places=5)
+        self.mock_character._keyword_multiplier_dirty = True
+        self.assertAlmostEqual(keyword_multiplier(self.mock_character), 1.3 * 1.4, places=5)
+
     def test_evaluate_inkwell_candidate(self):
         # High-cost card should be good for inking
         expensive_card = MagicMock()
         expensive_card.cost = 8  # Much higher than turn 3
         expensive_card.name = "Expensive Card"
         expensive_card.card_type = "Character"
+        expensive_card.lore = 1
+        expensive_card.strength = 2
+        expensive_card.willpower = 2
         expensive_card.abilities = []
+        expensive_card.banishes_item = False
+        expensive_card.banishes_character = False
         expensive_card.has_keyword = lambda keyword: False
         
         score = evaluate_inkwell_candidate(expensive_card, self.mock_player, self.mock_game)
@@ -119,6 +138,8 @@ class TestAdvancedHeuristics(unittest.TestCase):
         key_card.willpower = 6
         key_card.has_keyword = lambda keyword: keyword == "Shift"
         key_card.abilities = []
+        key_card.banishes_item = False
+        key_card.banishes_character = False
         
         score = evaluate_inkwell_candidate(key_card, self.mock_player, self.mock_game)
         self.assertLess(score, 0, "Key card should not be inked")
@@ -141,5 +162,22 @@ class TestAdvancedHeuristics(unittest.TestCase):
         if len(result) >= 2:
             self.assertGreaterEqual(result[0][1], result[1][1], "Actions should be sorted by score")
 
+    def test_score_actions_sets_scores_in_input_order(self):
+        actions = [MagicMock() for _ in range(3)]
+        
+        result = score_actions(self.mock_game, self.mock_player, actions)
+        self.assertEqual([action for action, _ in result], actions)
+        for action, score in result:
+            self.assertEqual(action.score, score)
+    
+    def test_max_ready_strength_ignores_exerted_and_non_characters(self):
+        exerted_character = MagicMock()
+        exerted_character.card_type = 'Character'
+        exerted_character.is_exerted = True
+        exerted_character.strength = 9
+        
+        self.assertEqual(max_ready_strength([self.mock_character, exerted_character, self.mock_item]), 3)
+        self.assertIsNone(max_ready_strength([exerted_character, self.mock_item]))
+
 if __name__ == '__main__':
     unittest.main()
@@ -70,5 +70,14 @@ class TestDeckGenerator(unittest.TestCase):
         unique_decks = {tuple(sorted(deck)) for deck in population}
         self.assertEqual(len(unique_decks), num_decks, "All generated decks in the population should be unique.")
 
+    def test_to_counts_matches_deck_copies(self):
+        """Tests that the copy count vector agrees with the deck's card ids."""
+        deck_ids = self.generator.generate_deck()
+        counts = self.generator.to_counts(deck_ids)
+        self.assertEqual(len(counts), len(self.generator.unique_card_names))
+        self.assertEqual(int(counts.sum()), 60)
+        for card_id, count in Counter(deck_ids).items():
+            self.assertEqual(counts[card_id], count)
+
 if __name__ == '__main__':
     unittest.main()
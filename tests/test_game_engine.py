@@ -62,6 +62,45 @@ class TestCard(unittest.TestCase):
         self.assertEqual(self.simple_card.lore, 4)
         self.assertIn('Evasive', self.simple_card.keywords)
 
+    def test_stats_are_normalized_to_ints(self):
+        """Tests that missing or float stats from card data become ints, with None only off characters."""
+        character = Card({'Name': 'Blank', 'Type': 'Character', 'Lore': float('nan'), 'Strength': 2.0}, owner_player_id=1)
+        self.assertEqual(character.lore, 0)
+        self.assertEqual(character.strength, 2)
+        self.assertIsInstance(character.strength, int)
+        self.assertEqual(character.willpower, 0)
+
+        item = Card({'Name': 'Trinket', 'Type': 'Item', 'Lore': None}, owner_player_id=1)
+        self.assertEqual(item.lore, 0)
+        self.assertIsNone(item.strength)
+        self.assertIsNone(item.willpower)
+
+    def test_engine_objects_have_no_instance_dict(self):
+        """Tests that Card, Player and GameState keep every attribute in slots."""
+        card = Card({'Name': 'Slotted', 'Type': 'Character'}, owner_player_id=1)
+        game = GameState(Player(1, initial_deck=Deck([])), Player(2, initial_deck=Deck([])))
+        for obj in (card, game.players[1], game):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+        with self.assertRaises(AttributeError):
+            card.not_a_card_field = True
+
+    def test_copies_share_parsed_abilities(self):
+        """Tests that copies of a card parse their ability JSON once but get their own ability lists."""
+        card_data = {'Name': 'Copy', 'schema_abilities': '[{"effect": "DrawCard", "target": "Self", "value": 1}]'}
+        first, second = Card(card_data, owner_player_id=1), Card(card_data, owner_player_id=2)
+        self.assertIs(first.abilities[0], second.abilities[0])
+        self.assertIsNot(first.abilities, second.abilities)
+        self.assertIn('effect_id', first.abilities[0])
+
+    def test_removal_flags_follow_reassigned_abilities(self):
+        """Tests that the removal tech flags come from the ability text and track a replaced ability list."""
+        card = Card({'Name': 'Remover', 'schema_abilities': '[{"effect": "Banish", "text": "Banish an item."}]'}, owner_player_id=1)
+        self.assertTrue(card.banishes_item)
+        self.assertFalse(card.banishes_character)
+        card.abilities = [{'effect': 'Banish', 'text': 'Banish a character.'}]
+        self.assertFalse(card.banishes_item)
+        self.assertTrue(card.banishes_character)
+
     def test_take_damage(self):
         """Tests that damage is applied correctly to a card."""
         self.simple_card.take_damage(3)
@@ -87,6 +126,15 @@ class TestCard(unittest.TestCase):
         self.assertTrue(self.shift_card.has_keyword('Shift'))
         self.assertTrue(self.shift_card.has_keyword('Singer'))
 
+    def test_has_keyword_sees_keywords_added_later(self):
+        """Tests that keywords added after the first check are found once the card is marked changed."""
+        self.assertFalse(self.simple_card.has_keyword('Ward'))
+        self.simple_card.keywords.add('Ward')
+        self.simple_card.mark_keywords_changed()
+        self.assertTrue(self.simple_card.has_keyword('Ward'))
+        self.simple_card.keyword_modifiers.append({'keyword': 'Rush', 'duration': 'end_of_turn'})
+        self.assertTrue(self.simple_card.has_keyword('Rush'))
+
     def test_get_keyword_value(self):
         """Tests parsing of numeric values from keywords."""
         self.assertIsNone(self.simple_card.get_keyword_value('Evasive'), "Keywords without values should return None")
@@ -95,6 +143,13 @@ class TestCard(unittest.TestCase):
         self.assertEqual(self.shift_card.get_keyword_value('Singer'), 6)
         self.assertIsNone(self.shift_card.get_keyword_value('Evasive'), "Non-existent keywords should return None")
 
+    def test_get_keyword_value_sees_keywords_added_later(self):
+        """Tests that a cached keyword value is re-parsed once the card is marked changed."""
+        self.assertIsNone(self.simple_card.get_keyword_value('Singer'))
+        self.simple_card.keywords.add('Singer 5')
+        self.simple_card.mark_keywords_changed()
+        self.assertEqual(self.simple_card.get_keyword_value('Singer'), 5)
+
 class TestPlayer(unittest.TestCase):
     """Tests the Player class from the game engine."""
 
@@ -1,9 +1,10 @@
 import unittest
 from unittest.mock import Mock, patch
 import numpy as np
+import pandas as pd
 from src.deck_generator import DeckGenerator
 from src.evolution import FitnessCalculator
-from src.genetic_algorithm import GeneticAlgorithm
+from src.genetic_algorithm import GeneticAlgorithm, UNBUILDABLE_DECK_FITNESS
 
 class TestGeneticAlgorithm(unittest.TestCase):
     def setUp(self):
@@ -138,5 +139,25 @@ class TestGeneticAlgorithm(unittest.TestCase):
             self.ga._fitness_function_wrapper = original_function
 
 
+class TestUnbuildableDeckFitness(unittest.TestCase):
+    def test_unknown_card_gets_finite_unbuildable_fitness(self):
+        """Tests that a deck with a card missing from the card data scores below every real deck."""
+        deck_generator = Mock()
+        deck_generator.card_df = pd.DataFrame([{'Name': 'Known Card', 'Type': 'Character'}])
+        deck_generator.unique_card_names = ['Known Card', 'Ghost Card']
+        deck_generator.id_to_card = {0: 'Known Card', 1: 'Ghost Card'}
+        fitness_calculator = FitnessCalculator(meta_decks=[['Known Card'] * 60], deck_generator=deck_generator)
+
+        with patch.object(GeneticAlgorithm, 'create_initial_population', return_value=[]):
+            ga = GeneticAlgorithm(deck_generator=deck_generator, fitness_calculator=fitness_calculator,
+                                  population_size=2, num_generations=1, num_parents_mating=2)
+
+        fitness_value = ga._fitness_function_wrapper(Mock(), [0] * 59 + [1], 0)
+
+        self.assertEqual(fitness_value, UNBUILDABLE_DECK_FITNESS)
+        self.assertTrue(np.isfinite(fitness_value))
+        self.assertLess(fitness_value, 0.0)
+        self.assertIsNone(ga.best_solution)
+
 if __name__ == '__main__':
     unittest.main()